@@ -3,7 +3,7 @@
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
@@ -257,8 +257,11 @@ class ManimBridge:
             self.observer.join()
             self.logger.info("Stopped watching for new videos")
 
-    def run(self, watch: bool = True):
+    def run(self, watch: bool = True, sleep: Optional[Callable[[float], None]] = None):
         """Main entry point for the bridge"""
+        # Resolved at call time so callers can inject a sleep (or patch time.sleep)
+        sleep = sleep or time.sleep
+
         try:
             # Print configuration
             self.logger.info(f"  Source: {self.config.source_dir}")
@@ -279,7 +282,7 @@ class ManimBridge:
                 # Keep running until interrupted
                 try:
                     while True:
-                        time.sleep(1)
+                        sleep(1)
 
                         # Log metrics periodically in dev mode
                         if self.config.enable_dev_logging:
@@ -4,17 +4,44 @@ Provides tools for analyzing, searching, and aggregating log data.
 """
 
 import json
+import os
 import re
 from collections import defaultdict, Counter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 import gzip
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both accept raw bytes, so log lines are never decoded to str before parsing
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Dynamic parts stripped from error messages when grouping them into patterns
+_TIMESTAMP_RE = re.compile(r'\b\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}')
+_PATH_RE = re.compile(r'/[^\s]+')
+_NUMBER_RE = re.compile(r'\b\d+\b')
+
+
+def _normalize_error_message(message: str) -> str:
+    """Replace timestamps, paths and numbers with placeholders."""
+    normalized = _TIMESTAMP_RE.sub('<timestamp>', message)
+    normalized = _PATH_RE.sub('<path>', normalized)
+    return _NUMBER_RE.sub('<number>', normalized)
+
 
 class LogEntry:
     """Represents a single log entry with parsing capabilities."""
 
+    # One instance per log line, so skip the per-instance __dict__
+    __slots__ = (
+        'raw_data', 'timestamp', 'level', 'component', 'module', 'function',
+        'message', 'action', 'data', 'performance', 'error', '_message_lower',
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self.raw_data = data
         self.timestamp = datetime.fromisoformat(data.get('timestamp', '').replace('Z', '+00:00'))
@@ -23,6 +50,7 @@ class LogEntry:
         self.module = data.get('module', '')
         self.function = data.get('function', '')
         self.message = data.get('message', '')
+        self._message_lower = self.message.lower()
         self.action = data.get('action', '')
         self.data = data.get('data', {})
         self.performance = data.get('performance', {})
@@ -46,7 +74,7 @@ class LogEntry:
                 return False
             elif key == 'before' and self.timestamp > value:
                 return False
-            elif key == 'text' and value.lower() not in self.message.lower():
+            elif key == 'text' and value.lower() not in self._message_lower:
                 return False
         return True
 
@@ -67,15 +95,17 @@ class LogParser:
             print(f"Warning: Log directory {self.log_directory} does not exist")
             return
 
+        current_logs, rotated_logs = self._discover_log_files()
+
         # Load current log files
-        for log_file in self.log_directory.glob("*.log"):
+        for log_file in current_logs:
             try:
                 self._parse_log_file(log_file)
             except Exception as e:
                 print(f"Error parsing {log_file}: {e}")
 
         # Load rotated log files
-        for log_file in self.log_directory.glob("*.log.*"):
+        for log_file in rotated_logs:
             try:
                 if log_file.suffix == '.gz':
                     self._parse_gzipped_log_file(log_file)
@@ -87,37 +117,45 @@ class LogParser:
         # Sort entries by timestamp
         self.entries.sort(key=lambda x: x.timestamp)
 
-    def _parse_log_file(self, file_path: Path) -> None:
-        """Parse a single log file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
+    def _discover_log_files(self) -> Tuple[List[Path], List[Path]]:
+        """Find current (*.log) and rotated (*.log.*) files in one directory scan."""
+        current_logs = []
+        rotated_logs = []
+        with os.scandir(self.log_directory) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                if not dir_entry.is_file():
                     continue
+                if name.endswith('.log'):
+                    current_logs.append(Path(dir_entry.path))
+                elif '.log.' in name:
+                    rotated_logs.append(Path(dir_entry.path))
+        return current_logs, rotated_logs
 
-                try:
-                    log_data = json.loads(line)
-                    entry = LogEntry(log_data)
-                    self.entries.append(entry)
-                except json.JSONDecodeError:
-                    print(f"Warning: Invalid JSON in {file_path}:{line_num}")
-                    continue
+    def _parse_log_file(self, file_path: Path) -> None:
+        """Parse a single log file."""
+        with open(file_path, 'rb') as f:
+            self._parse_lines(file_path, f)
 
     def _parse_gzipped_log_file(self, file_path: Path) -> None:
         """Parse a gzipped log file."""
-        with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+        with gzip.open(file_path, 'rb') as f:
+            self._parse_lines(file_path, f)
+
+    def _parse_lines(self, file_path: Path, lines: Iterable[bytes]) -> None:
+        """Parse raw JSON log lines into entries."""
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
 
-                try:
-                    log_data = json.loads(line)
-                    entry = LogEntry(log_data)
-                    self.entries.append(entry)
-                except json.JSONDecodeError:
-                    print(f"Warning: Invalid JSON in {file_path}:{line_num}")
-                    continue
+            try:
+                log_data = _json_loads(line)
+                entry = LogEntry(log_data)
+                self.entries.append(entry)
+            except json.JSONDecodeError:
+                print(f"Warning: Invalid JSON in {file_path}:{line_num}")
+                continue
 
     def search(self, **filters) -> List[LogEntry]:
         """
@@ -158,6 +196,26 @@ class LogParser:
 
         return results
 
+    def search_texts(self, keywords: List[str], case_sensitive: bool = False) -> List[LogEntry]:
+        """
+        Search for entries containing any of several literal keywords.
+
+        All keywords are matched in a single pass over each entry instead of
+        one pass over the logs per keyword.
+
+        Args:
+            keywords: Literal strings to search for
+            case_sensitive: Whether search should be case sensitive
+
+        Returns:
+            List of entries matching at least one keyword
+        """
+        if not keywords:
+            return []
+
+        pattern = '|'.join(re.escape(keyword) for keyword in dict.fromkeys(keywords))
+        return self.search_text(pattern, case_sensitive)
+
     def get_errors(self, since: Optional[datetime] = None) -> List[LogEntry]:
         """Get all error and critical level entries."""
         results = []
@@ -195,11 +253,13 @@ class LogParser:
             entry.performance.get('duration_seconds', 0)
             for entry in performance_entries
         ]
+        count = len(durations)
+        total_duration = sum(durations)
 
         return {
-            'count': len(performance_entries),
-            'total_duration': sum(durations),
-            'average_duration': sum(durations) / len(durations),
+            'count': count,
+            'total_duration': total_duration,
+            'average_duration': total_duration / count,
             'min_duration': min(durations),
             'max_duration': max(durations),
             'actions': Counter(entry.action for entry in performance_entries),
@@ -207,11 +267,13 @@ class LogParser:
 
     def get_component_stats(self) -> Dict[str, Dict[str, int]]:
         """Get statistics by component and log level."""
-        stats = defaultdict(lambda: defaultdict(int))
+        stats: Dict[str, Counter] = defaultdict(Counter)
 
         for entry in self.entries:
             stats[entry.component][entry.level] += 1
-            stats[entry.component]['total'] += 1
+
+        for level_counts in stats.values():
+            level_counts['total'] = sum(level_counts.values())
 
         return dict(stats)
 
@@ -224,28 +286,18 @@ class LogParser:
             if entry.timestamp.replace(tzinfo=None) >= since
         ]
 
-        hourly_counts = defaultdict(int)
-        for entry in recent_entries:
-            hour_key = entry.timestamp.strftime('%Y-%m-%d %H:00')
-            hourly_counts[hour_key] += 1
+        hourly_counts = Counter(
+            entry.timestamp.strftime('%Y-%m-%d %H:00') for entry in recent_entries
+        )
 
         return dict(hourly_counts)
 
     def get_error_patterns(self) -> Dict[str, int]:
         """Analyze common error patterns."""
-        error_entries = self.get_errors()
-        error_messages = [entry.message for entry in error_entries]
-
         # Simple pattern extraction - group similar error messages
-        patterns = defaultdict(int)
-        for message in error_messages:
-            # Remove dynamic parts like timestamps, file paths, etc.
-            normalized = re.sub(r'\b\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}', '<timestamp>', message)
-            normalized = re.sub(r'/[^\s]+', '<path>', normalized)
-            normalized = re.sub(r'\b\d+\b', '<number>', normalized)
-
-            patterns[normalized] += 1
-
+        patterns = Counter(
+            _normalize_error_message(entry.message) for entry in self.get_errors()
+        )
         return dict(patterns)
 
     def generate_report(self, output_file: Optional[Path] = None) -> str:
@@ -291,8 +343,8 @@ class LogParser:
         errors = self.get_errors()
         if errors:
             report_lines.append(f"=== ERRORS ({len(errors)} total) ===")
-            error_patterns = self.get_error_patterns()
-            for pattern, count in sorted(error_patterns.items(), key=lambda x: x[1], reverse=True)[:10]:
+            error_patterns = Counter(self.get_error_patterns())
+            for pattern, count in error_patterns.most_common(10):
                 report_lines.append(f"{count}x: {pattern}")
             report_lines.append("")
 
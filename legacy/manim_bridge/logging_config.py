@@ -6,13 +6,43 @@ Provides structured JSON logging with rotation and performance context.
 import json
 import logging
 import logging.handlers
+import os
+import socket
 import sys
 import time
 import traceback
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+else:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+# Resolved once per process instead of per record
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+
+def _refresh_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the naive record timestamp the way orjson's UTC options do."""
+    if isinstance(obj, datetime):
+        return obj.isoformat() + "Z"
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 class StructuredJSONFormatter(logging.Formatter):
@@ -23,18 +53,37 @@ class StructuredJSONFormatter(logging.Formatter):
     def __init__(self, component: str = "manim-bridge"):
         super().__init__()
         self.component = component
+        # Fields that never change between records; copied per record
+        self._base = {
+            "component": component,
+            "hostname": _HOSTNAME,
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
-        log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat() + "Z",
-            "level": record.levelname,
-            "component": self.component,
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-            "message": record.getMessage(),
-        }
+        log_entry = self._build_entry(record)
+        if orjson is not None:
+            return orjson.dumps(log_entry, option=_ORJSON_OPTIONS).decode()
+        return json.dumps(log_entry, ensure_ascii=False, default=_json_default)
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as a UTF-8 encoded JSON line, newline included."""
+        log_entry = self._build_entry(record)
+        if orjson is not None:
+            return orjson.dumps(log_entry, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        line = json.dumps(log_entry, ensure_ascii=False, default=_json_default) + "\n"
+        return line.encode("utf-8")
+
+    def _build_entry(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Collect the structured fields for a log record."""
+        log_entry = self._base.copy()
+        log_entry["pid"] = _PID
+        log_entry["timestamp"] = datetime.fromtimestamp(record.created)
+        log_entry["level"] = record.levelname
+        log_entry["module"] = record.module
+        log_entry["function"] = record.funcName
+        log_entry["line"] = record.lineno
+        log_entry["message"] = record.getMessage()
 
         # Add extra fields if present
         if hasattr(record, "action"):
@@ -65,7 +114,47 @@ class StructuredJSONFormatter(logging.Formatter):
                     "traceback": []
                 }
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return log_entry
+
+
+class StructuredJSONFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes structured JSON records as UTF-8 bytes.
+
+    Each record is formatted once per emit, and that line's byte length is
+    used for the rollover check, instead of formatting again as
+    RotatingFileHandler.shouldRollover does.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode + "b")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if isinstance(self.formatter, StructuredJSONFormatter):
+                line = self.formatter.format_bytes(record)
+            else:
+                line = (self.format(record) + self.terminator).encode("utf-8")
+
+            if self.stream is None:
+                self.stream = self._open()
+
+            # Never roll over anything other than regular files (bpo-45401)
+            if (
+                self.maxBytes > 0
+                and self.stream.tell() + len(line) >= self.maxBytes
+                and os.path.isfile(self.baseFilename)
+            ):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(line)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class PerformanceLogger:
@@ -78,20 +167,26 @@ class PerformanceLogger:
         self.action = action
         self.data = kwargs
         self.start_time = None
+        # Resolved once so disabled levels skip building the extra dicts
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        self._info_enabled = logger.isEnabledFor(logging.INFO)
 
     def __enter__(self):
-        self.start_time = time.time()
-        self.logger.debug(
-            f"Starting {self.action}",
-            extra={
-                "action": f"{self.action}_start",
-                "data": self.data
-            }
-        )
+        self.start_time = time.perf_counter()
+        if self._debug_enabled:
+            self.logger.debug(
+                f"Starting {self.action}",
+                extra={
+                    "action": f"{self.action}_start",
+                    "data": self.data
+                }
+            )
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
+        if not exc_type and not self._info_enabled:
+            return
 
         performance_data = {
             "duration_seconds": round(duration, 3),
@@ -126,7 +221,8 @@ def setup_logger(
     log_dir: Optional[Path] = None,
     component: str = "manim-bridge",
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    buffer_capacity: int = 0
 ) -> logging.Logger:
     """
     Set up a structured JSON logger with file rotation.
@@ -138,6 +234,9 @@ def setup_logger(
         component: Component identifier for log entries
         max_bytes: Maximum size per log file before rotation
         backup_count: Number of backup files to keep
+        buffer_capacity: Number of records to buffer before writing to the log
+            file. WARNING and above flush immediately, and logging's exit hook
+            flushes the rest. 0 writes every record straight through.
 
     Returns:
         Configured logger instance
@@ -151,7 +250,9 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
 
-    # Clear existing handlers
+    # Clear existing handlers, writing out anything still buffered
+    for handler in logger.handlers:
+        handler.flush()
     logger.handlers.clear()
 
     # Create formatter
@@ -159,14 +260,23 @@ def setup_logger(
 
     # File handler with rotation
     log_file = log_dir / f"{component}.log"
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = StructuredJSONFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
         encoding="utf-8"
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    if buffer_capacity > 0:
+        logger.addHandler(
+            logging.handlers.MemoryHandler(
+                capacity=buffer_capacity,
+                flushLevel=logging.WARNING,
+                target=file_handler
+            )
+        )
+    else:
+        logger.addHandler(file_handler)
 
     # Console handler for development (optional)
     if sys.stdout.isatty():
@@ -199,7 +309,7 @@ def log_performance(logger: logging.Logger, action: str, **kwargs):
 def log_file_operation(
     logger: logging.Logger,
     action: str,
-    filepath: Path,
+    filepath: Union[str, os.PathLike],
     success: bool = True,
     error: Optional[Exception] = None,
     **kwargs
@@ -215,16 +325,23 @@ def log_file_operation(
         error: Exception if operation failed
         **kwargs: Additional data to log
     """
+    path_str = os.fspath(filepath)
+    filename = os.path.basename(path_str)
+    try:
+        size = os.stat(path_str).st_size
+    except OSError:
+        size = None
+
     data = {
-        "filepath": str(filepath),
-        "filename": filepath.name,
-        "size": filepath.stat().st_size if filepath.exists() else None,
+        "filepath": path_str,
+        "filename": filename,
+        "size": size,
         **kwargs
     }
 
     if success:
         logger.info(
-            f"Successfully {action} {filepath.name}",
+            f"Successfully {action} {filename}",
             extra={
                 "action": f"file_{action}",
                 "data": data
@@ -237,7 +354,7 @@ def log_file_operation(
         }
 
         logger.error(
-            f"Failed to {action} {filepath.name}",
+            f"Failed to {action} {filename}",
             extra={
                 "action": f"file_{action}_error",
                 "data": data,
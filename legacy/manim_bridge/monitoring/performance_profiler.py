@@ -224,7 +224,7 @@ class PerformanceProfiler:
                     operation=snapshot.operation,
                     duration=snapshot.duration,
                     status=status,
-                    thread=snapshot.thread_id,
+                    thread_id=snapshot.thread_id,
                     extra_info=f"{memory_info}{cpu_info}"
                 )
 
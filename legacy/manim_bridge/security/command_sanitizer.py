@@ -2,11 +2,30 @@
 
 import re
 import shlex
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from ..core.exceptions import SecurityError
 from ..monitoring.logger import get_logger
 
+# Prefer RE2 when installed: it guarantees linear-time matching on
+# pathological inputs, whereas the stdlib engine backtracks
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _compile_union(patterns: List[str]) -> Any:
+    """Compile patterns into a single case-insensitive alternation
+
+    Returns an ``re.Pattern`` or, when RE2 is installed, an RE2 pattern
+    exposing the same ``search`` API.
+    """
+    union = "(?i)" + "|".join(f"(?:{pattern})" for pattern in patterns)
+    if re2 is not None:
+        return re2.compile(union)
+    return re.compile(union)
+
 
 class CommandSanitizer:
     """Sanitizes commands for safe subprocess execution"""
@@ -19,6 +38,8 @@ class CommandSanitizer:
         r">\s*/dev/",  # Redirect to device files
         r"rm\s+-rf\s+/",  # Dangerous rm commands
     ]
+    _DANGEROUS_RE = _compile_union(DANGEROUS_PATTERNS)
+    _UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\-_\.]")
 
     def __init__(self, enable_logging: bool = False):
         self.logger = get_logger() if enable_logging else None
@@ -31,9 +52,8 @@ class CommandSanitizer:
                 raise SecurityError(f"Dangerous character '{char}' found in filename: {filename}")
 
         # Check for dangerous patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, filename, re.IGNORECASE):
-                raise SecurityError(f"Dangerous pattern found in filename: {filename}")
+        if self._DANGEROUS_RE.search(filename):
+            raise SecurityError(f"Dangerous pattern found in filename: {filename}")
 
         # Check for path traversal attempts
         if ".." in filename or filename.startswith("/") or "\\" in filename:
@@ -50,7 +70,7 @@ class CommandSanitizer:
         sanitized = sanitized.replace(" ", "_")
 
         # Remove special characters
-        sanitized = re.sub(r"[^\w\-_\.]", "", sanitized)
+        sanitized = self._UNSAFE_FILENAME_CHARS_RE.sub("", sanitized)
 
         # Ensure it doesn't start with a dash (could be interpreted as flag)
         if sanitized.startswith("-"):
@@ -113,11 +133,10 @@ class CommandSanitizer:
                 return False
 
         # Check for dangerous patterns
-        for pattern in self.DANGEROUS_PATTERNS:
-            if re.search(pattern, command_str, re.IGNORECASE):
-                if self.logger:
-                    self.logger.warning(f"Dangerous pattern found in command: {command_str}")
-                return False
+        if self._DANGEROUS_RE.search(command_str):
+            if self.logger:
+                self.logger.warning(f"Dangerous pattern found in command: {command_str}")
+            return False
 
         return True
 
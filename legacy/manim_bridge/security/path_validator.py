@@ -1,18 +1,71 @@
 """Path validation and sandboxing for security"""
 
 import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Tuple
 
 from ..core.exceptions import SecurityError
 from ..monitoring.logger import get_logger
 
+# Attack tokens that can be rejected from the raw string alone, matched in a
+# single pass: control characters (including null bytes), percent-encoded
+# traversal and bidi override characters. Shell metacharacters are legal in
+# file names and paths are never handed to a shell, so they are left to
+# CommandSanitizer.
+_ATTACK_RE = re.compile(r"[\x00-\x1f]|%(?:2e|2f|5c|c0|25|00)|[\u202a-\u202e]", re.IGNORECASE)
+
+
+# Device and pseudo-filesystem locations, and Windows reserved device names
+# (matched on the file stem, case-insensitively, e.g. "con.mp4")
+_UNIX_DEVICE_PREFIXES = ("/dev/", "/proc/", "/sys/")
+_WIN_DEVICE_NAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+)
+
+
+@lru_cache(maxsize=1024)
+def _syntactic_reject(path: str) -> bool:
+    """Check whether a raw path string is unsafe without touching the filesystem"""
+    return _ATTACK_RE.search(path) is not None
+
+
+@dataclass(frozen=True)
+class ValidationContext:
+    """Immutable snapshot of canonicalized allowed directories"""
+
+    roots: Tuple[str, ...]
+    prefixes: Tuple[str, ...]
+    root_set: FrozenSet[str]
+
+    @classmethod
+    def from_directories(cls, directories: Tuple[Path, ...]) -> "ValidationContext":
+        """Build a context from already-resolved directories"""
+        roots = tuple(str(d) for d in directories)
+        return cls(
+            roots=roots,
+            prefixes=tuple(os.path.join(root, "") for root in roots),
+            root_set=frozenset(roots),
+        )
+
+    def contains(self, resolved: str) -> bool:
+        """Check an already-resolved path string against the allowed prefixes"""
+        # str.startswith with a tuple tests every prefix in a single C-level call
+        return resolved in self.root_set or resolved.startswith(self.prefixes)
+
 
 class PathValidator:
     """Validates and sanitizes file paths for security"""
 
     def __init__(self, allowed_directories: List[Path], enable_logging: bool = False):
-        self.allowed_dirs = [Path(d).resolve() for d in allowed_directories]
+        # Published once as immutable snapshots so concurrent readers in
+        # is_safe never need a lock
+        self.allowed_dirs = tuple(Path(d).resolve() for d in allowed_directories)
+        self._context = ValidationContext.from_directories(self.allowed_dirs)
         self.logger = get_logger() if enable_logging else None
 
         if self.logger:
@@ -21,6 +74,27 @@ class PathValidator:
     def is_safe(self, path: str) -> bool:
         """Check if path is within allowed directories"""
         try:
+            raw = os.fspath(path)
+
+            # Null bytes are rejected with a plain substring test (memchr) before
+            # the regex or any Path construction
+            if "\x00" in raw:
+                if self.logger:
+                    self.logger.warning(f"Path rejected for null byte: {path!r}")
+                return False
+
+            # Reject syntactically unsafe input before any filesystem access
+            if _syntactic_reject(raw):
+                if self.logger:
+                    self.logger.warning(f"Path rejected by syntactic check: {path!r}")
+                return False
+
+            # Reject device files by prefix/name lookup, also before resolving
+            if self._is_device(raw):
+                if self.logger:
+                    self.logger.warning(f"Device path rejected: {path}")
+                return False
+
             # Handle circular symlinks gracefully
             try:
                 resolved = Path(path).resolve()
@@ -38,9 +112,7 @@ class PathValidator:
                 pass  # Continue to check resolved path
 
             # Check if path is within allowed directories
-            is_allowed = any(
-                self._is_subpath(resolved, allowed_dir) for allowed_dir in self.allowed_dirs
-            )
+            is_allowed = self._context.contains(str(resolved))
 
             if not is_allowed and self.logger:
                 self.logger.warning(f"Path outside allowed directories: {resolved}")
@@ -52,6 +124,15 @@ class PathValidator:
                 self.logger.error(f"Path validation error for {path}: {e}")
             return False
 
+    def _is_device(self, path: str) -> bool:
+        """Check if a raw path names a device file or pseudo-filesystem entry"""
+        # An allowed directory that itself lives under e.g. /dev/shm stays usable
+        if path.startswith(_UNIX_DEVICE_PREFIXES) and not self._context.contains(path):
+            return True
+
+        stem = os.path.basename(path).split(".", 1)[0].upper()
+        return stem in _WIN_DEVICE_NAMES
+
     def _is_subpath(self, path: Path, parent: Path) -> bool:
         """Check if path is a subpath of parent"""
         try:
@@ -88,7 +169,15 @@ class PathValidator:
 
     def is_within_sandbox(self, path: Path) -> bool:
         """Check if a resolved path is within allowed directories"""
-        return any(self._is_subpath(path, allowed_dir) for allowed_dir in self.allowed_dirs)
+        try:
+            resolved = Path(path).resolve()
+        except RuntimeError as e:
+            # Handle circular symlinks
+            if "Symlink loop" in str(e):
+                return False
+            raise
+
+        return self._context.contains(str(resolved))
 
     def validate_input_path(self, path: str, must_exist: bool = True) -> Path:
         """Validate an input file path"""
@@ -22,6 +22,7 @@ class ManifestHandler:
         self.profiler = get_profiler() if enable_profiling else None
         self._cache = {}
         self._cache_valid = False
+        self._last_written: Optional[Dict[str, Any]] = None
         self._lock = threading.RLock()  # Reentrant lock for thread safety
 
         # Ensure manifest exists
@@ -152,6 +153,7 @@ class ManifestHandler:
 
                 # Invalidate cache
                 self._cache_valid = False
+                self._last_written = dict(data)
 
                 if self.logger:
                     self.logger.debug(f"Manifest written: {len(data)} entries")
@@ -162,6 +164,17 @@ class ManifestHandler:
                     Path(temp_path).unlink()
                 raise ManifestError(f"Failed to write manifest: {e}")
 
+    def get_last_written(self) -> Dict[str, Any]:
+        """Return what this handler last wrote, without re-parsing the file
+
+        Falls back to a fresh read if nothing has been written yet. Writes made
+        by other processes are not reflected; use read(use_cache=False) for that.
+        """
+        with self._lock:
+            if self._last_written is None:
+                return self.read(use_cache=False)
+            return dict(self._last_written)
+
     def add_entry(self, key: str, value: Dict[str, Any]):
         """Add or update a single entry"""
         with self._lock:
@@ -318,6 +318,7 @@ class TestRunner:
             "pytest",
             "-m",
             "slow",
+            "--runslow",
             "-v",
             "--tb=short",
             "tests/",
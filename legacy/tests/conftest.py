@@ -5,8 +5,10 @@ Pytest configuration and shared fixtures for Manim-Remotion Bridge tests
 import json
 import logging
 import os
+import shutil
 import sys
 from collections.abc import Generator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import Mock
@@ -53,6 +55,20 @@ def temp_workspace(tmp_path) -> Generator[Path, None, None]:
     yield workspace
 
 
+@pytest.fixture(scope="session")
+def shared_readonly_workspace(tmp_path_factory) -> Path:
+    """
+    Session-wide workspace with prebuilt ``allowed/`` and ``case/Allowed/`` directories.
+
+    Only for tests that never write into it, e.g. attack-string validation.
+    ``case/`` sits apart from ``allowed/`` so case-insensitive filesystems don't collide.
+    """
+    workspace = tmp_path_factory.mktemp("secro")
+    (workspace / "allowed").mkdir()
+    (workspace / "case" / "Allowed").mkdir(parents=True)
+    return workspace
+
+
 @pytest.fixture
 def mock_video_file(temp_workspace) -> Path:
     """
@@ -431,6 +447,20 @@ class TestVideoGenerator:
         path.write_bytes(content)
         return path
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _fake_video_content(signature: bytes, size: int) -> bytes:
+        """Build (once per signature/size) the bytes create_fake_video would write."""
+        content = signature + b"fake_video_content" * (size // 20)
+        return content[:size]  # Trim to exact size
+
+    @staticmethod
+    def create_fake_video_fast(path: Path, size: int = 1024) -> Path:
+        """Write cached fake MP4 bytes; the parent directory must already exist."""
+        signature = TestVideoGenerator.VIDEO_SIGNATURES[".mp4"]
+        path.write_bytes(TestVideoGenerator._fake_video_content(signature, size))
+        return path
+
     @staticmethod
     def create_invalid_video(path: Path, size: int = 1024) -> Path:
         """Create an invalid video file with wrong header."""
@@ -517,6 +547,59 @@ def manim_bridge(basic_bridge_config: BridgeConfig) -> ManimBridge:
     return ManimBridge(basic_bridge_config)
 
 
+def _create_shared_bridge(workspace: Path, **overrides) -> ManimBridge:
+    """Build a bridge over a source/target/manifest layout inside workspace."""
+    config = BridgeConfig(
+        source_dir=workspace / "source",
+        target_dir=workspace / "target",
+        manifest_file=workspace / "manifest.json",
+        **overrides,
+    )
+    return ManimBridge(config)
+
+
+def _reset_shared_bridge(bridge: ManimBridge) -> None:
+    """Return a shared bridge's on-disk state to a freshly constructed one."""
+    config = bridge.config
+    bridge.manifest_handler.write({})
+    bridge.metrics.reset()
+    shutil.rmtree(config.source_dir, ignore_errors=True)
+    shutil.rmtree(config.target_dir, ignore_errors=True)
+    config.target_dir.mkdir()
+
+
+@pytest.fixture(scope="class")
+def _shared_bridge(tmp_path_factory) -> ManimBridge:
+    """One ManimBridge per test class; see the ``bridge`` fixture."""
+    return _create_shared_bridge(tmp_path_factory.mktemp("bridge"))
+
+
+@pytest.fixture(scope="class")
+def _shared_bridge_dev(tmp_path_factory) -> ManimBridge:
+    """One dev-logging ManimBridge per test class; see ``bridge_dev``."""
+    return _create_shared_bridge(tmp_path_factory.mktemp("bridge_dev"), enable_dev_logging=True)
+
+
+@pytest.fixture
+def bridge(_shared_bridge: ManimBridge) -> Generator[ManimBridge, None, None]:
+    """
+    ManimBridge shared across a test class, reset after every test.
+
+    Construction (config resolution, manifest creation, logging setup) is paid
+    once per class; each test still starts from an empty manifest, reset
+    metrics and empty source/target directories.
+    """
+    yield _shared_bridge
+    _reset_shared_bridge(_shared_bridge)
+
+
+@pytest.fixture
+def bridge_dev(_shared_bridge_dev: ManimBridge) -> Generator[ManimBridge, None, None]:
+    """Same as ``bridge`` but with ``enable_dev_logging=True``."""
+    yield _shared_bridge_dev
+    _reset_shared_bridge(_shared_bridge_dev)
+
+
 # Video file fixtures
 @pytest.fixture
 def sample_bridge_video(temp_workspace: Path) -> Path:
@@ -735,6 +818,16 @@ def clean_bridge_env():
 
 
 # Pytest configuration functions
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run slow tests at full size (e.g. the 1GB resource exhaustion file)",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     markers = [
@@ -746,6 +839,7 @@ def pytest_configure(config):
         "slow: Tests that take a long time to run",
         "concurrent: Tests that test concurrent access scenarios",
         "requires_ffmpeg: Tests that require ffmpeg to be installed",
+        "xdist_group(name): Keep tests on one worker under pytest-xdist --dist loadgroup",
     ]
 
     for marker in markers:
@@ -5,12 +5,13 @@ Tests both Python logging (manim-bridge) and integration points.
 
 import json
 import logging
+import os
+import socket
 import tempfile
-import time
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -26,6 +27,41 @@ from manim_bridge.logging_config import (
 from manim_bridge.log_parser import LogEntry, LogParser
 
 
+class _Recorder:
+    """Callable that records its calls, exposing the mock attributes the tests use."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    @property
+    def call_args(self):
+        return self.calls[-1] if self.calls else None
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+
+class RecordingLogger:
+    """Lightweight stand-in for logging.Logger that records each call."""
+
+    def __init__(self):
+        self.debug = _Recorder()
+        self.info = _Recorder()
+        self.warning = _Recorder()
+        self.error = _Recorder()
+        self.log = _Recorder()
+
+    def isEnabledFor(self, level):
+        return True
+
+
 class TestStructuredJSONFormatter(unittest.TestCase):
     """Test the structured JSON formatter."""
 
@@ -56,6 +92,72 @@ class TestStructuredJSONFormatter(unittest.TestCase):
         self.assertEqual(parsed["message"], "Test message")
         self.assertIn("timestamp", parsed)
 
+    def test_static_fields(self):
+        """Test hostname and pid are included in every record."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        first = json.loads(self.formatter.format(record))
+        second = json.loads(self.formatter.format(record))
+
+        self.assertEqual(first["pid"], os.getpid())
+        self.assertEqual(first["hostname"], socket.gethostname())
+        self.assertEqual(first["component"], "test-component")
+        self.assertEqual(second["component"], "test-component")
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_pid_refreshed_after_fork(self):
+        """Test a forked child reports its own pid."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                os.write(write_fd, self.formatter.format(record).encode("utf-8"))
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as reader:
+            parsed = json.loads(reader.read())
+        os.waitpid(pid, 0)
+
+        self.assertEqual(parsed["pid"], pid)
+
+    def test_format_bytes(self):
+        """Test byte output is the UTF-8 encoded JSON line."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Caf\u00e9 message",
+            args=(),
+            exc_info=None,
+        )
+
+        line = self.formatter.format_bytes(record)
+
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(json.loads(line), json.loads(self.formatter.format(record)))
+        self.assertEqual(json.loads(line)["message"], "Caf\u00e9 message")
+
     def test_extra_fields(self):
         """Test formatting with extra fields."""
         record = logging.LogRecord(
@@ -112,12 +214,15 @@ class TestPerformanceLogger(unittest.TestCase):
     """Test the performance logging context manager."""
 
     def setUp(self):
-        self.logger = MagicMock(spec=logging.Logger)
+        self.logger = RecordingLogger()
 
     def test_successful_operation(self):
         """Test logging successful operation."""
-        with PerformanceLogger(self.logger, "test_operation", param="value"):
-            time.sleep(0.01)  # Small delay to ensure measurable duration
+        with patch(
+            "manim_bridge.logging_config.time.perf_counter", side_effect=[0.0, 0.05]
+        ):
+            with PerformanceLogger(self.logger, "test_operation", param="value"):
+                pass
 
         # Should log start and complete
         self.assertEqual(self.logger.debug.call_count, 1)
@@ -129,7 +234,7 @@ class TestPerformanceLogger(unittest.TestCase):
         self.assertIn("Completed test_operation", complete_call[0][0])
         extra = complete_call[1]["extra"]
         self.assertEqual(extra["action"], "test_operation_complete")
-        self.assertIn("duration_seconds", extra["performance"])
+        self.assertEqual(extra["performance"]["duration_seconds"], 0.05)
 
     def test_failed_operation(self):
         """Test logging failed operation."""
@@ -142,63 +247,96 @@ class TestPerformanceLogger(unittest.TestCase):
         self.assertEqual(self.logger.error.call_count, 1)
         self.assertEqual(self.logger.info.call_count, 0)
 
+    def test_disabled_levels_skipped(self):
+        """Test start and complete records are skipped when their levels are off."""
+        self.logger.isEnabledFor = lambda level: level >= logging.WARNING
+
+        with PerformanceLogger(self.logger, "test_operation"):
+            pass
 
-class TestSetupLogger(unittest.TestCase):
+        self.assertEqual(self.logger.debug.call_count, 0)
+        self.assertEqual(self.logger.info.call_count, 0)
+
+        with self.assertRaises(ValueError):
+            with PerformanceLogger(self.logger, "test_operation"):
+                raise ValueError("Test error")
+
+        self.assertEqual(self.logger.error.call_count, 1)
+
+
+class TestSetupLogger:
     """Test logger setup function."""
 
-    def test_logger_setup(self):
+    def test_logger_setup(self, tmp_path):
         """Test basic logger setup."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir)
-            logger = setup_logger(
-                name="test-logger",
-                log_level="DEBUG",
-                log_dir=log_dir,
-                component="test-component",
-            )
+        logger = setup_logger(
+            name="test-logger",
+            log_level="DEBUG",
+            log_dir=tmp_path,
+            component="test-component",
+        )
 
-            # Test logging
-            logger.info("Test message")
+        # Test logging
+        logger.info("Test message")
 
-            # Check log file was created
-            log_file = log_dir / "test-component.log"
-            self.assertTrue(log_file.exists())
+        # Check log file was created
+        log_file = tmp_path / "test-component.log"
+        assert log_file.exists()
 
-            # Check log content
-            with open(log_file) as f:
-                log_line = f.readline().strip()
-                parsed = json.loads(log_line)
-                self.assertEqual(parsed["level"], "INFO")
-                self.assertEqual(parsed["component"], "test-component")
-                self.assertEqual(parsed["message"], "Test message")
+        # Check log content
+        parsed = json.loads(log_file.read_text().splitlines()[0])
+        assert parsed["level"] == "INFO"
+        assert parsed["component"] == "test-component"
+        assert parsed["message"] == "Test message"
 
-    def test_log_rotation(self):
+    def test_log_rotation(self, tmp_path):
         """Test log file rotation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir)
-            logger = setup_logger(
-                name="test-logger",
-                log_level="DEBUG",
-                log_dir=log_dir,
-                component="test-component",
-                max_bytes=100,  # Very small file size for testing
-                backup_count=2,
-            )
+        logger = setup_logger(
+            name="test-logger",
+            log_level="DEBUG",
+            log_dir=tmp_path,
+            component="test-component",
+            max_bytes=100,  # Very small file size for testing
+            backup_count=2,
+        )
+
+        # Generate enough logs to trigger rotation
+        for i in range(50):
+            logger.info(f"Test message {i} with some extra content to increase size")
+
+        # Check that rotation occurred
+        log_files = list(tmp_path.glob("test-component.log*"))
+        assert len(log_files) > 1
+
+    def test_buffered_logging(self, tmp_path):
+        """Test buffered records are written on a WARNING."""
+        logger = setup_logger(
+            name="test-buffered-logger",
+            log_level="DEBUG",
+            log_dir=tmp_path,
+            component="test-component",
+            buffer_capacity=100,
+        )
+
+        log_file = tmp_path / "test-component.log"
+        logger.info("Buffered message")
+        assert log_file.read_text() == ""
 
-            # Generate enough logs to trigger rotation
-            for i in range(50):
-                logger.info(f"Test message {i} with some extra content to increase size")
+        logger.warning("Flush trigger")
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["message"] == "Buffered message"
+        assert json.loads(lines[1])["level"] == "WARNING"
 
-            # Check that rotation occurred
-            log_files = list(log_dir.glob("test-component.log*"))
-            self.assertGreater(len(log_files), 1)
+        for handler in logger.handlers:
+            handler.close()
 
 
 class TestLogHelpers(unittest.TestCase):
     """Test logging helper functions."""
 
     def setUp(self):
-        self.logger = MagicMock(spec=logging.Logger)
+        self.logger = RecordingLogger()
 
     def test_log_file_operation_success(self):
         """Test successful file operation logging."""
@@ -238,6 +376,19 @@ class TestLogHelpers(unittest.TestCase):
         self.assertEqual(extra["action"], "file_copy_error")
         self.assertIn("error", extra)
 
+    def test_log_file_operation_str_path(self):
+        """Test file operation logging accepts a plain string path."""
+        with tempfile.NamedTemporaryFile() as temp_file:
+            temp_file.write(b"data")
+            temp_file.flush()
+
+            log_file_operation(self.logger, "copy", temp_file.name)
+
+            extra = self.logger.info.call_args[1]["extra"]
+            self.assertEqual(extra["data"]["filepath"], temp_file.name)
+            self.assertEqual(extra["data"]["filename"], Path(temp_file.name).name)
+            self.assertEqual(extra["data"]["size"], 4)
+
     def test_log_system_event(self):
         """Test system event logging."""
         log_system_event(
@@ -261,12 +412,15 @@ class TestLogPerformanceContextManager(unittest.TestCase):
     """Test the log_performance context manager."""
 
     def setUp(self):
-        self.logger = MagicMock(spec=logging.Logger)
+        self.logger = RecordingLogger()
 
     def test_performance_logging(self):
         """Test performance context manager."""
-        with log_performance(self.logger, "test_operation", param="value"):
-            time.sleep(0.01)
+        with patch(
+            "manim_bridge.logging_config.time.perf_counter", side_effect=[0.0, 0.05]
+        ):
+            with log_performance(self.logger, "test_operation", param="value"):
+                pass
 
         # Should have debug and info calls
         self.assertEqual(self.logger.debug.call_count, 1)
@@ -319,25 +473,53 @@ class TestLogEntry(unittest.TestCase):
         self.assertFalse(entry.matches_filter({"text": "NotFound"}))
 
 
-class TestLogParser(unittest.TestCase):
+# Most fixture entries share this exact schema, so their lines come from a template
+BASE_LOG_KEYS = ("timestamp", "level", "component", "message")
+BASE_LOG_TEMPLATE = '{"timestamp":%s,"level":%s,"component":%s,"message":%s}\n'
+
+
+def _log_line(entry: dict) -> str:
+    """Serialize one fixture entry as a JSON line."""
+    if tuple(entry) == BASE_LOG_KEYS:
+        return BASE_LOG_TEMPLATE % tuple(json.dumps(entry[key]) for key in BASE_LOG_KEYS)
+    return json.dumps(entry) + "\n"
+
+
+def create_test_log(log_dir: Path, filename: str, entries: list):
+    """Create a test log file with given entries."""
+    log_file = log_dir / filename
+    log_file.write_text("".join(_log_line(entry) for entry in entries))
+
+
+SEARCH_ENTRIES = (
+    {
+        "timestamp": "2023-09-05T10:30:00Z",
+        "level": "INFO",
+        "component": "test1",
+        "message": "Info message",
+    },
+    {
+        "timestamp": "2023-09-05T10:31:00Z",
+        "level": "ERROR",
+        "component": "test2",
+        "message": "Error message",
+    },
+)
+
+
+class TestLogParser:
     """Test LogParser class."""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.log_dir = Path(self.temp_dir)
+    def test_create_test_log_template(self, tmp_path):
+        """Test templated fixture lines decode to the original entries."""
+        entries = [dict(SEARCH_ENTRIES[0], message='Quote " and \\ backslash')]
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        create_test_log(tmp_path, "test.log", entries)
 
-    def create_test_log(self, filename: str, entries: list):
-        """Create a test log file with given entries."""
-        log_file = self.log_dir / filename
-        with open(log_file, 'w') as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + '\n')
+        lines = (tmp_path / "test.log").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == entries
 
-    def test_load_logs(self):
+    def test_load_logs(self, tmp_path):
         """Test loading logs from directory."""
         entries = [
             {
@@ -354,49 +536,66 @@ class TestLogParser(unittest.TestCase):
             },
         ]
 
-        self.create_test_log("test.log", entries)
+        create_test_log(tmp_path, "test.log", entries)
 
-        parser = LogParser(self.log_dir)
-        self.assertEqual(len(parser.entries), 2)
-        self.assertEqual(parser.entries[0].message, "Test message 1")
-        self.assertEqual(parser.entries[1].message, "Test message 2")
+        parser = LogParser(tmp_path)
+        assert len(parser.entries) == 2
+        assert parser.entries[0].message == "Test message 1"
+        assert parser.entries[1].message == "Test message 2"
 
-    def test_search_functionality(self):
-        """Test log search functionality."""
-        entries = [
-            {
-                "timestamp": "2023-09-05T10:30:00Z",
-                "level": "INFO",
-                "component": "test1",
-                "message": "Info message",
-            },
-            {
-                "timestamp": "2023-09-05T10:31:00Z",
-                "level": "ERROR",
-                "component": "test2",
-                "message": "Error message",
-            },
-        ]
-
-        self.create_test_log("test.log", entries)
-        parser = LogParser(self.log_dir)
+    def test_load_logs_invalid_and_gzipped(self, tmp_path):
+        """Test invalid lines are skipped and rotated gzip logs are read."""
+        import gzip
 
-        # Test level filter
-        info_logs = parser.search(level="INFO")
-        self.assertEqual(len(info_logs), 1)
-        self.assertEqual(info_logs[0].message, "Info message")
-
-        # Test component filter
-        test1_logs = parser.search(component="test1")
-        self.assertEqual(len(test1_logs), 1)
-        self.assertEqual(test1_logs[0].component, "test1")
+        entry = {
+            "timestamp": "2023-09-05T10:30:00Z",
+            "level": "INFO",
+            "component": "test",
+            "message": "Rotated message",
+        }
+        (tmp_path / "test.log").write_bytes(b"not json\n\n")
+        with gzip.open(tmp_path / "test.log.1.gz", "wt", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        parser = LogParser(tmp_path)
+        assert len(parser.entries) == 1
+        assert parser.entries[0].message == "Rotated message"
+
+    def test_load_logs_includes_hidden_files(self, tmp_path):
+        """Test dot-prefixed logs are loaded, as Path.glob('*.log') would find them."""
+        create_test_log(tmp_path, ".hidden.log", [SEARCH_ENTRIES[0]])
+        create_test_log(tmp_path, ".hidden.log.1", [SEARCH_ENTRIES[1]])
+        (tmp_path / "dir.log").mkdir()
+
+        parser = LogParser(tmp_path)
+        assert len(parser.entries) == 2
+
+    @pytest.mark.parametrize(
+        "search, expected_messages",
+        [
+            (lambda parser: parser.search(level="INFO"), ["Info message"]),
+            (lambda parser: parser.search(component="test1"), ["Info message"]),
+            (lambda parser: parser.search_text("Error"), ["Error message"]),
+            (
+                lambda parser: parser.search_texts(["info", "error"]),
+                ["Info message", "Error message"],
+            ),
+            (
+                lambda parser: parser.search_texts(["Info", "missing"], case_sensitive=True),
+                ["Info message"],
+            ),
+            (lambda parser: parser.search_texts(["(unbalanced"]), []),
+        ],
+        ids=["level", "component", "text", "keywords", "keywords-case", "keywords-literal"],
+    )
+    def test_search_functionality(self, tmp_path, search, expected_messages):
+        """Test log search functionality."""
+        create_test_log(tmp_path, "test.log", SEARCH_ENTRIES)
+        parser = LogParser(tmp_path)
 
-        # Test text search
-        error_logs = parser.search_text("Error")
-        self.assertEqual(len(error_logs), 1)
-        self.assertEqual(error_logs[0].level, "ERROR")
+        assert [entry.message for entry in search(parser)] == expected_messages
 
-    def test_performance_stats(self):
+    def test_performance_stats(self, tmp_path):
         """Test performance statistics generation."""
         entries = [
             {
@@ -417,17 +616,17 @@ class TestLogParser(unittest.TestCase):
             },
         ]
 
-        self.create_test_log("test.log", entries)
-        parser = LogParser(self.log_dir)
+        create_test_log(tmp_path, "test.log", entries)
+        parser = LogParser(tmp_path)
 
         stats = parser.get_performance_stats()
-        self.assertEqual(stats["count"], 2)
-        self.assertEqual(stats["total_duration"], 4.0)
-        self.assertEqual(stats["average_duration"], 2.0)
-        self.assertEqual(stats["min_duration"], 1.5)
-        self.assertEqual(stats["max_duration"], 2.5)
+        assert stats["count"] == 2
+        assert stats["total_duration"] == 4.0
+        assert stats["average_duration"] == 2.0
+        assert stats["min_duration"] == 1.5
+        assert stats["max_duration"] == 2.5
 
-    def test_error_analysis(self):
+    def test_error_analysis(self, tmp_path):
         """Test error analysis functionality."""
         entries = [
             {
@@ -444,42 +643,26 @@ class TestLogParser(unittest.TestCase):
             },
         ]
 
-        self.create_test_log("test.log", entries)
-        parser = LogParser(self.log_dir)
+        create_test_log(tmp_path, "test.log", entries)
+        parser = LogParser(tmp_path)
 
         errors = parser.get_errors()
-        self.assertEqual(len(errors), 2)
+        assert len(errors) == 2
 
         patterns = parser.get_error_patterns()
-        self.assertIn("File not found: <path>", patterns)
-        self.assertEqual(patterns["File not found: <path>"], 2)
+        assert patterns["File not found: <path>"] == 2
 
-    def test_report_generation(self):
+    def test_report_generation(self, tmp_path):
         """Test report generation."""
-        entries = [
-            {
-                "timestamp": "2023-09-05T10:30:00Z",
-                "level": "INFO",
-                "component": "test",
-                "message": "Info message",
-            },
-            {
-                "timestamp": "2023-09-05T10:31:00Z",
-                "level": "ERROR",
-                "component": "test",
-                "message": "Error message",
-            },
-        ]
-
-        self.create_test_log("test.log", entries)
-        parser = LogParser(self.log_dir)
+        create_test_log(tmp_path, "test.log", SEARCH_ENTRIES)
+        parser = LogParser(tmp_path)
 
         report = parser.generate_report()
-        self.assertIn("LOG ANALYSIS REPORT", report)
-        self.assertIn("Total entries: 2", report)
-        self.assertIn("LOG LEVEL DISTRIBUTION", report)
-        self.assertIn("INFO:", report)
-        self.assertIn("ERROR:", report)
+        assert "LOG ANALYSIS REPORT" in report
+        assert "Total entries: 2" in report
+        assert "LOG LEVEL DISTRIBUTION" in report
+        assert "INFO:" in report
+        assert "ERROR:" in report
 
 
 class TestIntegration(unittest.TestCase):
@@ -505,7 +688,7 @@ class TestIntegration(unittest.TestCase):
 
             # Log with performance data
             with log_performance(logger, "test_operation"):
-                time.sleep(0.01)
+                pass
 
             # Log file operation
             test_file = Path(temp_dir) / "test.txt"
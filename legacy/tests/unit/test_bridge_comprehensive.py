@@ -5,14 +5,16 @@ Tests all error handling paths, edge cases, and exception scenarios.
 
 import json
 import pytest
-import tempfile
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, PropertyMock, call
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, PropertyMock, call
 
 from manim_bridge import ManimBridge
-from manim_bridge.bridge import ManimBridgeHandler
+from manim_bridge.bridge import ManimBridgeHandler, main
 from manim_bridge.core.config import BridgeConfig
 from manim_bridge.core.exceptions import (
     BridgeException,
@@ -24,18 +26,13 @@ from manim_bridge.processing.video_processor import VideoInfo
 
 
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmp_path):
     """Create temporary workspace for tests"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = Path(tmpdir)
+    # Create required directories
+    (tmp_path / "manim-output").mkdir()
+    (tmp_path / "remotion-app/public/assets/manim").mkdir(parents=True)
 
-        # Create required directories
-        source_dir = workspace / "manim-output"
-        target_dir = workspace / "remotion-app/public/assets/manim"
-        source_dir.mkdir(parents=True)
-        target_dir.mkdir(parents=True)
-
-        yield workspace
+    return tmp_path
 
 
 @pytest.fixture
@@ -51,50 +48,119 @@ def bridge_config(temp_workspace):
     )
 
 
+# The handler only reads these two attributes from watchdog events
+Event = namedtuple("Event", "is_directory src_path")
+
+# Shared by every test; the bridge only reads it
+VIDEO_INFO = VideoInfo(
+    path=Path("/test/video.mp4"),
+    hash="abc123def456",
+    size=1024000,
+    scene_name="TestScene",
+    quality="1080p60",
+    duration=30.5,
+    resolution=(1920, 1080),
+    codec="h264",
+)
+
+
 @pytest.fixture
+def no_sleep():
+    """Skip the real polling delay in _wait_for_file_complete"""
+    with patch("manim_bridge.bridge.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(scope="session")
+def shared_video_file(tmp_path_factory):
+    """Create one video file for tests that never read its contents"""
+    video_file = tmp_path_factory.mktemp("videos") / "test.mp4"
+    video_file.write_bytes(b"video")
+    return video_file
+
+
+@pytest.fixture(scope="module")
 def mock_video_info():
-    """Create mock video info object"""
-    return VideoInfo(
-        path=Path("/test/video.mp4"),
-        hash="abc123def456",
-        size=1024000,
-        scene_name="TestScene",
-        quality="1080p60",
-        duration=30.5,
-        resolution=(1920, 1080),
-        codec="h264",
+    """Provide the shared video info object"""
+    return VIDEO_INFO
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_setup_logging():
+    """Patch bridge logging setup once for the whole module"""
+    with patch("manim_bridge.bridge.setup_logging") as mock_setup:
+        yield mock_setup
+
+
+MOCKED_COMPONENTS = (
+    "path_validator",
+    "manifest_handler",
+    "file_operations",
+    "hash_calculator",
+    "video_processor",
+    "metrics",
+    "logger",
+)
+
+
+def _apply_mock_defaults(bridge):
+    """Setup default mock behaviors"""
+    bridge.path_validator.is_safe.return_value = True
+    bridge.manifest_handler.needs_processing.return_value = True
+    bridge.video_processor.is_video_file.return_value = True
+    bridge.video_processor.is_excluded.return_value = False
+    bridge.video_processor.validate_video.return_value = True
+
+    # Mock the metrics context manager
+    mock_context = Mock()
+    mock_context.__enter__ = Mock(return_value=mock_context)
+    mock_context.__exit__ = Mock(return_value=None)
+    bridge.metrics.measure.return_value = mock_context
+
+
+@pytest.fixture(scope="module")
+def _module_bridge(tmp_path_factory):
+    """Build one bridge with mocked components for the whole module"""
+    workspace = tmp_path_factory.mktemp("bridge-workspace")
+    config = BridgeConfig(
+        source_dir=workspace / "manim-output",
+        target_dir=workspace / "remotion-app/public/assets/manim",
+        manifest_file=workspace / ".manim-bridge-manifest.json",
+        enable_dev_logging=False,
+        create_latest_symlink=True,
+        update_index=True,
     )
+    config.source_dir.mkdir(parents=True)
+
+    bridge = ManimBridge(config)
+
+    # Mock the internal components
+    for name in MOCKED_COMPONENTS:
+        setattr(bridge, name, Mock())
+
+    return bridge
 
 
 @pytest.fixture
-def bridge(bridge_config):
-    """Create bridge instance with mocked dependencies"""
-    with patch("manim_bridge.bridge.setup_logging"):
-        bridge = ManimBridge(bridge_config)
+def bridge(_module_bridge):
+    """Provide the shared bridge with mocks and per-test overrides reset"""
+    bridge = _module_bridge
 
-        # Mock the internal components
-        bridge.path_validator = Mock()
-        bridge.manifest_handler = Mock()
-        bridge.file_operations = Mock()
-        bridge.hash_calculator = Mock()
-        bridge.video_processor = Mock()
-        bridge.metrics = Mock()
-        bridge.logger = Mock()
+    for name in MOCKED_COMPONENTS:
+        getattr(bridge, name).reset_mock(return_value=True, side_effect=True)
+    _apply_mock_defaults(bridge)
 
-        # Setup default mock behaviors
-        bridge.path_validator.is_safe.return_value = True
-        bridge.manifest_handler.needs_processing.return_value = True
-        bridge.video_processor.is_video_file.return_value = True
-        bridge.video_processor.is_excluded.return_value = False
-        bridge.video_processor.validate_video.return_value = True
+    # Drop methods replaced on the instance by earlier tests
+    for name in ("_wait_for_file_complete", "update_video_index", "process_file"):
+        vars(bridge).pop(name, None)
+    bridge.observer = None
+    bridge.config.create_latest_symlink = True
+    bridge.config.update_index = True
 
-        # Mock the metrics context manager
-        mock_context = Mock()
-        mock_context.__enter__ = Mock(return_value=mock_context)
-        mock_context.__exit__ = Mock(return_value=None)
-        bridge.metrics.measure.return_value = mock_context
+    for path in bridge.config.target_dir.iterdir():
+        path.unlink()
 
-        return bridge
+    return bridge
 
 
 class TestManimBridgeInitialization:
@@ -102,11 +168,10 @@ class TestManimBridgeInitialization:
 
     def test_successful_initialization(self, bridge_config):
         """Test successful bridge initialization"""
-        with patch("manim_bridge.bridge.setup_logging"):
-            bridge = ManimBridge(bridge_config)
+        bridge = ManimBridge(bridge_config)
 
-            assert bridge.config == bridge_config
-            assert bridge.logger is not None
+        assert bridge.config == bridge_config
+        assert bridge.logger is not None
 
     def test_initialization_with_missing_directories(self, temp_workspace):
         """Test initialization when directories don't exist"""
@@ -116,51 +181,115 @@ class TestManimBridgeInitialization:
             manifest_file=temp_workspace / "manifest.json",
         )
 
-        with patch("manim_bridge.bridge.setup_logging"):
-            bridge = ManimBridge(config)
+        bridge = ManimBridge(config)
 
-            # Only target directory is created by BridgeConfig
-            # Source directory is expected to exist already (where manim outputs go)
-            assert config.target_dir.exists()
-            # Source dir won't be created automatically
-            assert not config.source_dir.exists()
+        # Only target directory is created by BridgeConfig
+        # Source directory is expected to exist already (where manim outputs go)
+        assert config.target_dir.exists()
+        # Source dir won't be created automatically
+        assert not config.source_dir.exists()
 
-    def test_initialization_with_dev_logging(self, bridge_config):
+    def test_initialization_with_dev_logging(self, bridge_config, _patch_setup_logging):
         """Test initialization with development logging enabled"""
         bridge_config.enable_dev_logging = True
 
-        with patch("manim_bridge.bridge.setup_logging") as mock_setup:
-            bridge = ManimBridge(bridge_config)
+        bridge = ManimBridge(bridge_config)
 
-            mock_setup.assert_called_with(
-                name="manim-bridge",
-                level="INFO",  # Level stays as INFO even with dev logging
-                enable_dev=True,
-                log_file=bridge_config.log_file,
-                log_performance=False,  # This parameter is always passed
-            )
+        _patch_setup_logging.assert_called_with(
+            name="manim-bridge",
+            level="INFO",  # Level stays as INFO even with dev logging
+            enable_dev=True,
+            log_file=bridge_config.log_file,
+            log_performance=False,  # This parameter is always passed
+        )
 
 
 class TestProcessFile:
     """Test file processing functionality"""
 
-    def test_process_file_success(self, bridge, mock_video_info, temp_workspace):
-        """Test successful video file processing"""
-        video_file = temp_workspace / "test_video.mp4"
-        video_file.write_bytes(b"fake video content")
+    @pytest.mark.parametrize(
+        "setup, expected, check",
+        [
+            pytest.param(
+                lambda b: None,
+                True,
+                lambda b: (
+                    b.file_operations.atomic_copy.assert_called_once(),
+                    b.manifest_handler.add_entry.assert_called_once(),
+                ),
+                id="success",
+            ),
+            pytest.param(
+                lambda b: setattr(b.manifest_handler.needs_processing, "return_value", False),
+                False,
+                lambda b: (
+                    b.logger.debug.assert_called(),
+                    b.file_operations.atomic_copy.assert_not_called(),
+                ),
+                id="already_processed",
+            ),
+            pytest.param(
+                lambda b: setattr(b.config, "create_latest_symlink", True),
+                True,
+                lambda b: b.file_operations.safe_symlink.assert_called_once(),
+                id="with_symlink_creation",
+            ),
+            pytest.param(
+                lambda b: setattr(b.config, "create_latest_symlink", False),
+                True,
+                lambda b: b.file_operations.safe_symlink.assert_not_called(),
+                id="without_symlink",
+            ),
+            pytest.param(
+                lambda b: setattr(b, "update_video_index", Mock()),
+                True,
+                lambda b: b.update_video_index.assert_called_once(),
+                id="with_index_update",
+            ),
+            pytest.param(
+                lambda b: setattr(
+                    b.video_processor.extract_metadata,
+                    "side_effect",
+                    ProcessingError("Extraction failed"),
+                ),
+                False,
+                lambda b: b.logger.error.assert_called(),
+                id="extraction_error",
+            ),
+            pytest.param(
+                lambda b: setattr(
+                    b.file_operations.atomic_copy, "side_effect", IOError("Copy failed")
+                ),
+                False,
+                lambda b: b.logger.error.assert_called(),
+                id="copy_error",
+            ),
+            pytest.param(
+                lambda b: setattr(
+                    b.manifest_handler.add_entry, "side_effect", ManifestError("Update failed")
+                ),
+                False,
+                lambda b: b.logger.error.assert_called(),
+                id="manifest_update_error",
+            ),
+        ],
+    )
+    def test_process_file_outcomes(
+        self, bridge, mock_video_info, shared_video_file, setup, expected, check
+    ):
+        """Test video file processing outcomes once the file is complete"""
+        video_file = shared_video_file
 
-        # Mock _wait_for_file_complete to return True for successful processing
+        # Mock _wait_for_file_complete to return True so processing proceeds
         bridge._wait_for_file_complete = Mock(return_value=True)
         bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.video_processor.generate_output_filename.return_value = (
-            "TestScene_1080p60_20240115_120000.mp4"
-        )
+        bridge.video_processor.generate_output_filename.return_value = "output.mp4"
+        setup(bridge)
 
         result = bridge.process_file(video_file)
 
-        assert result is True
-        bridge.file_operations.atomic_copy.assert_called_once()
-        bridge.manifest_handler.add_entry.assert_called_once()
+        assert result is expected
+        check(bridge)
 
     def test_process_file_nonexistent(self, bridge):
         """Test processing non-existent file"""
@@ -184,10 +313,9 @@ class TestProcessFile:
 
         assert result is False
 
-    def test_process_file_excluded(self, bridge, temp_workspace):
+    def test_process_file_excluded(self, bridge, shared_video_file):
         """Test processing excluded file"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         bridge.video_processor.is_excluded.return_value = True
 
@@ -195,10 +323,9 @@ class TestProcessFile:
 
         assert result is False
 
-    def test_process_file_unsafe_path(self, bridge, temp_workspace):
+    def test_process_file_unsafe_path(self, bridge, shared_video_file):
         """Test processing file with unsafe path"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         bridge.path_validator.is_safe.return_value = False
 
@@ -207,147 +334,30 @@ class TestProcessFile:
         assert result is False
         bridge.logger.warning.assert_called_with(f"Unsafe path rejected: {video_file}")
 
-    def test_process_file_still_writing(self, bridge, temp_workspace):
+    @pytest.mark.usefixtures("no_sleep")
+    def test_process_file_still_writing(self, bridge, shared_video_file):
         """Test processing file still being written"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         # Mock file size changing
         with patch.object(Path, "stat") as mock_stat:
-            mock_stat.return_value.st_size = 100
-
             # Simulate file size changing on each check
             mock_stat.side_effect = [
-                MagicMock(st_size=100),
-                MagicMock(st_size=200),
-                MagicMock(st_size=300),
+                SimpleNamespace(st_size=size) for size in (100, 200, 300)
             ] * 20  # Enough for timeout
 
             result = bridge.process_file(video_file)
 
             assert result is False
 
-    def test_process_file_already_processed(self, bridge, mock_video_info, temp_workspace):
-        """Test processing already processed file"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True so we get to the processing check
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.manifest_handler.needs_processing.return_value = False
-
-        result = bridge.process_file(video_file)
-
-        assert result is False
-        bridge.logger.debug.assert_called()
-        bridge.file_operations.atomic_copy.assert_not_called()
-
-    def test_process_file_with_symlink_creation(self, bridge, mock_video_info, temp_workspace):
-        """Test processing with symlink creation enabled"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True for successful processing
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.config.create_latest_symlink = True
-        bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.video_processor.generate_output_filename.return_value = "output.mp4"
-
-        result = bridge.process_file(video_file)
-
-        assert result is True
-        bridge.file_operations.safe_symlink.assert_called_once()
-
-    def test_process_file_without_symlink(self, bridge, mock_video_info, temp_workspace):
-        """Test processing with symlink creation disabled"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True for successful processing
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.config.create_latest_symlink = False
-        bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.video_processor.generate_output_filename.return_value = "output.mp4"
-
-        result = bridge.process_file(video_file)
-
-        assert result is True
-        bridge.file_operations.safe_symlink.assert_not_called()
-
-    def test_process_file_with_index_update(self, bridge, mock_video_info, temp_workspace):
-        """Test processing with index update enabled"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True for successful processing
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.config.update_index = True
-        bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.video_processor.generate_output_filename.return_value = "output.mp4"
-
-        # Mock update_video_index method
-        bridge.update_video_index = Mock()
-
-        result = bridge.process_file(video_file)
-
-        assert result is True
-        bridge.update_video_index.assert_called_once()
-
-    def test_process_file_extraction_error(self, bridge, temp_workspace):
-        """Test processing with metadata extraction error"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True so we get to the extraction step
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.video_processor.extract_metadata.side_effect = ProcessingError("Extraction failed")
-
-        result = bridge.process_file(video_file)
-
-        assert result is False
-        bridge.logger.error.assert_called()
-
-    def test_process_file_copy_error(self, bridge, mock_video_info, temp_workspace):
-        """Test processing with file copy error"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True so we get to the copy step
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.video_processor.generate_output_filename.return_value = "output.mp4"
-        bridge.file_operations.atomic_copy.side_effect = IOError("Copy failed")
-
-        result = bridge.process_file(video_file)
-
-        assert result is False
-        bridge.logger.error.assert_called()
-
-    def test_process_file_manifest_update_error(self, bridge, mock_video_info, temp_workspace):
-        """Test processing with manifest update error"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
-
-        # Mock _wait_for_file_complete to return True so we get to the manifest step
-        bridge._wait_for_file_complete = Mock(return_value=True)
-        bridge.video_processor.extract_metadata.return_value = mock_video_info
-        bridge.video_processor.generate_output_filename.return_value = "output.mp4"
-        bridge.manifest_handler.add_entry.side_effect = ManifestError("Update failed")
-
-        result = bridge.process_file(video_file)
-
-        assert result is False
-        bridge.logger.error.assert_called()
-
 
+@pytest.mark.usefixtures("no_sleep")
 class TestWaitForFileComplete:
     """Test file completion waiting functionality"""
 
-    def test_wait_for_file_complete_success(self, bridge, temp_workspace):
+    def test_wait_for_file_complete_success(self, bridge, shared_video_file):
         """Test successful file completion wait"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video content")
+        video_file = shared_video_file
 
         # Mock stable file size
         with patch.object(Path, "stat") as mock_stat:
@@ -358,15 +368,14 @@ class TestWaitForFileComplete:
             assert result is True
             bridge.video_processor.validate_video.assert_called_with(video_file)
 
-    def test_wait_for_file_timeout(self, bridge, temp_workspace):
+    def test_wait_for_file_timeout(self, bridge, shared_video_file):
         """Test file wait timeout"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         # Mock changing file size
         with patch.object(Path, "stat") as mock_stat:
             sizes = [100, 200, 300, 400, 500]
-            mock_stat.side_effect = [MagicMock(st_size=size) for size in sizes] * 10
+            mock_stat.side_effect = [SimpleNamespace(st_size=size) for size in sizes] * 10
 
             result = bridge._wait_for_file_complete(video_file, timeout=2)
 
@@ -383,10 +392,9 @@ class TestWaitForFileComplete:
             assert result is False
             bridge.logger.error.assert_called()
 
-    def test_wait_for_file_validation_failure(self, bridge, temp_workspace):
+    def test_wait_for_file_validation_failure(self, bridge, shared_video_file):
         """Test file validation failure after wait"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"invalid video")
+        video_file = shared_video_file
 
         bridge.video_processor.validate_video.return_value = False
 
@@ -466,8 +474,6 @@ class TestUpdateVideoIndex:
         index_file = target_dir / "index.json"
         assert index_file.exists()
 
-        import json
-
         with open(index_file) as f:
             data = json.load(f)
         assert "videos" in data
@@ -481,8 +487,6 @@ class TestUpdateVideoIndex:
         index_file = bridge.config.target_dir / "index.json"
         assert index_file.exists()
 
-        import json
-
         with open(index_file) as f:
             data = json.load(f)
         assert isinstance(data, dict)
@@ -492,8 +496,6 @@ class TestUpdateVideoIndex:
     def test_update_video_index_with_error(self, bridge):
         """Test index update with write error"""
         # Make target directory non-writable to cause error
-        import os
-
         target_dir = bridge.config.target_dir
 
         with patch("builtins.open", side_effect=IOError("Write failed")):
@@ -503,54 +505,42 @@ class TestUpdateVideoIndex:
             bridge.logger.error.assert_called()
 
 
+@pytest.fixture(scope="class")
+def handler(_module_bridge):
+    """Create one event handler around the shared bridge"""
+    return ManimBridgeHandler(_module_bridge)
+
+
 class TestEventHandlers:
     """Test file system event handlers"""
 
-    def test_handler_on_created(self, bridge):
+    def test_handler_on_created(self, bridge, handler):
         """Test handler on_created event"""
-        handler = ManimBridgeHandler(bridge)
-
-        event = Mock()
-        event.is_directory = False
-        event.src_path = "/test/video.mp4"
+        event = Event(is_directory=False, src_path="/test/video.mp4")
 
         with patch.object(bridge, "process_file") as mock_process:
             handler.on_created(event)
 
             mock_process.assert_called_once_with(Path(event.src_path))
 
-    def test_handler_on_created_directory(self, bridge):
+    def test_handler_on_created_directory(self, bridge, handler):
         """Test handler ignores directory creation"""
-        handler = ManimBridgeHandler(bridge)
-
-        event = Mock()
-        event.is_directory = True
-        event.src_path = "/test/directory"
+        event = Event(is_directory=True, src_path="/test/directory")
 
         with patch.object(bridge, "process_file") as mock_process:
             handler.on_created(event)
 
             mock_process.assert_not_called()
 
-    def test_handler_on_modified(self, bridge):
+    def test_handler_on_modified(self, bridge, handler):
         """Test handler on_modified event"""
-        handler = ManimBridgeHandler(bridge)
-
-        event = Mock()
-        event.is_directory = False
-        event.src_path = "/test/video.mp4"
+        event = Event(is_directory=False, src_path="/test/video.mp4")
 
         with patch.object(bridge, "process_file") as mock_process:
             handler.on_modified(event)
 
             mock_process.assert_called_once_with(Path(event.src_path))
 
-    def test_handler_process_new_file(self, bridge, temp_workspace):
-        """Test handler process_new_file method (removed - not in actual implementation)"""
-        # This method doesn't exist in the actual implementation
-        # The handler calls bridge.process_file directly from on_created/on_modified
-        pass
-
 
 class TestWatchLoop:
     """Test watch loop functionality"""
@@ -589,59 +579,53 @@ class TestWatchLoop:
                 bridge.start_watching()
 
 
+@pytest.fixture
+def mock_bridge_cls():
+    """Patch the bridge class that main() instantiates"""
+    with patch("manim_bridge.bridge.ManimBridge") as mock_cls:
+        yield mock_cls
+
+
 class TestMainFunction:
     """Test main entry point function"""
 
-    def test_main_function_normal_mode(self):
+    def test_main_function_normal_mode(self, mock_bridge_cls, monkeypatch):
         """Test main function in normal watching mode"""
-        test_args = ["manim-bridge.py", "--source", "test-source", "--target", "test-target"]
-
-        with patch("sys.argv", test_args):
-            with patch("manim_bridge.bridge.ManimBridge") as MockBridge:
-                mock_bridge = MockBridge.return_value
-
-                from manim_bridge.bridge import main
+        monkeypatch.setattr(
+            "sys.argv",
+            ["manim-bridge.py", "--source", "test-source", "--target", "test-target"],
+        )
 
-                main()
+        main()
 
-                # Main calls bridge.run(watch=True)
-                mock_bridge.run.assert_called_once_with(watch=True)
+        # Main calls bridge.run(watch=True)
+        mock_bridge_cls.return_value.run.assert_called_once_with(watch=True)
 
-    def test_main_function_scan_only(self):
+    def test_main_function_scan_only(self, mock_bridge_cls, monkeypatch):
         """Test main function in scan-only mode"""
-        test_args = ["manim-bridge.py", "--scan-only"]
-
-        with patch("sys.argv", test_args):
-            with patch("manim_bridge.bridge.ManimBridge") as MockBridge:
-                mock_bridge = MockBridge.return_value
+        monkeypatch.setattr("sys.argv", ["manim-bridge.py", "--scan-only"])
 
-                from manim_bridge.bridge import main
+        main()
 
-                main()
+        # Main calls bridge.run(watch=False) for scan-only
+        mock_bridge_cls.return_value.run.assert_called_once_with(watch=False)
 
-                # Main calls bridge.run(watch=False) for scan-only
-                mock_bridge.run.assert_called_once_with(watch=False)
-
-    def test_main_function_with_dev_flag(self):
+    def test_main_function_with_dev_flag(self, mock_bridge_cls, monkeypatch):
         """Test main function with development flag"""
-        test_args = ["manim-bridge.py", "--dev"]
-
-        with patch("sys.argv", test_args):
-            with patch("manim_bridge.bridge.ManimBridge") as MockBridge:
-                from manim_bridge.bridge import main
+        monkeypatch.setattr("sys.argv", ["manim-bridge.py", "--dev"])
 
-                main()
+        main()
 
-                # Check that dev mode was enabled in config
-                call_args = MockBridge.call_args
-                config = call_args[0][0]
-                assert config.enable_dev_logging is True
+        # Check that dev mode was enabled in config
+        config = mock_bridge_cls.call_args[0][0]
+        assert config.enable_dev_logging is True
 
 
+@pytest.mark.usefixtures("no_sleep")
 class TestErrorRecovery:
     """Test error recovery and resilience"""
 
-    def test_recover_from_manifest_corruption(self, bridge, temp_workspace):
+    def test_recover_from_manifest_corruption(self, bridge, temp_workspace, shared_video_file):
         """Test recovery from corrupted manifest"""
         manifest_file = temp_workspace / ".manim-bridge-manifest.json"
         manifest_file.write_text("corrupted json {]")
@@ -652,18 +636,16 @@ class TestErrorRecovery:
             {},  # Second read returns empty
         ]
 
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         result = bridge.process_file(video_file)
 
         # Should recover and process the file
         assert bridge.logger.error.called or bridge.logger.warning.called
 
-    def test_recover_from_disk_full(self, bridge, mock_video_info, temp_workspace):
+    def test_recover_from_disk_full(self, bridge, mock_video_info, shared_video_file):
         """Test recovery from disk full error"""
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         bridge.video_processor.extract_metadata.return_value = mock_video_info
         bridge.file_operations.atomic_copy.side_effect = OSError("No space left on device")
@@ -673,29 +655,18 @@ class TestErrorRecovery:
         assert result is False
         bridge.logger.error.assert_called()
 
-    def test_concurrent_access_handling(self, bridge, mock_video_info, temp_workspace):
+    @pytest.mark.concurrent
+    @pytest.mark.xdist_group("threaded")
+    def test_concurrent_access_handling(self, bridge, mock_video_info, shared_video_file):
         """Test handling of concurrent file access"""
-        import threading
-
-        video_file = temp_workspace / "test.mp4"
-        video_file.write_bytes(b"video")
+        video_file = shared_video_file
 
         bridge.video_processor.extract_metadata.return_value = mock_video_info
         bridge.video_processor.generate_output_filename.return_value = "output.mp4"
 
-        results = []
-
-        def process_video():
-            result = bridge.process_file(video_file)
-            results.append(result)
-
-        # Create multiple threads trying to process same file
-        threads = [threading.Thread(target=process_video) for _ in range(5)]
-
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        # Multiple threads trying to process same file
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(executor.map(lambda _: bridge.process_file(video_file), range(5)))
 
         # At least one should succeed
         assert any(results)
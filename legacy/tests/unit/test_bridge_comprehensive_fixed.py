@@ -1,13 +1,22 @@
 """Comprehensive tests for the ManimBridge class focusing on edge cases and error handling"""
 
+import copy
+import dataclasses
 import json
+import logging
+import os
+import shutil
+import tempfile
 import time
+from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
-from watchdog.events import FileCreatedEvent, FileModifiedEvent
+from watchdog.events import DirCreatedEvent, FileCreatedEvent, FileModifiedEvent
 
+import manim_bridge.bridge as bridge_module
 from manim_bridge.bridge import ManimBridge, ManimBridgeHandler
 from manim_bridge.core.config import BridgeConfig
 from manim_bridge.core.exceptions import (
@@ -15,75 +24,212 @@ from manim_bridge.core.exceptions import (
     SecurityError,
     BridgeException,
 )
+from manim_bridge.monitoring.metrics import PerformanceMonitor
+from manim_bridge.security.path_validator import PathValidator
+from manim_bridge.storage.manifest_handler import ManifestHandler
+
+
+# process_file only reads attributes off the metadata, so a plain namespace stands in for
+# VideoInfo; each test gets a shallow copy through the video_info fixture
+_VIDEO_INFO_PROTO = SimpleNamespace(
+    hash="abc123",
+    scene_name="TestScene",
+    quality="1080p",
+    size=15000,
+    duration=30.5,
+    codec="h264",
+)
+
+# on_created only reads is_directory and src_path, so the events are shared read-only
+_VIDEO_EVENT = FileCreatedEvent(src_path="source/new.mp4")
+_DIR_EVENT = DirCreatedEvent(src_path="source/newdir")
+
+# (component, attribute, return value) patches that carry a file past the happy_path
+# predicates through the rest of ManimBridge.process_file
+VALID_PROCESSING_PATCHES = (
+    ("video_processor", "extract_metadata", None),
+    ("video_processor", "generate_output_filename", "test.mp4"),
+    ("file_operations", "atomic_copy", True),
+)
+
+
+class _StubManifestHandler:
+    """Manifest that wants every file processed and accepts every entry"""
+
+    needs_processing = staticmethod(lambda *args, **kwargs: True)
+    add_entry = staticmethod(lambda *args, **kwargs: None)
+    read = staticmethod(lambda *args, **kwargs: {})
+
+
+def _apply_patches(stack, bridge, specs):
+    """Enter a patch.object for each spec on the stack and return the mocks by attribute"""
+    mocks = {}
+    for component, attribute, return_value in specs:
+        mocks[attribute] = stack.enter_context(
+            patch.object(getattr(bridge, component), attribute, return_value=return_value)
+        )
+    return mocks
+
+
+# Handed to ManimBridge in place of setup_logging's logger so tests stay quiet
+_NULL_LOGGER = logging.getLogger("manim-bridge.tests")
+_NULL_LOGGER.addHandler(logging.NullHandler())
+_NULL_LOGGER.propagate = False
+
+
+class _CallCounter:
+    """Callable that only counts how often it was called"""
+
+    def __init__(self):
+        self.n = 0
+
+    def __call__(self, *args, **kwargs):
+        self.n += 1
+
+
+class _FakeObserver:
+    """Running observer whose stop() and join() calls are counted"""
+
+    def __init__(self):
+        self.stop = _CallCounter()
+        self.join = _CallCounter()
+
+    def is_alive(self):
+        return True
+
+
+@pytest.fixture(scope="session")
+def _bridge_template(tmp_path_factory):
+    """Build the ManimBridge and its stateless components once for the whole session"""
+    root = tmp_path_factory.mktemp("bridge_template")
+    config = BridgeConfig(
+        source_dir=root / "source",
+        target_dir=root / "target",
+        manifest_file=root / "manifest.json",
+        max_workers=2,
+        enable_dev_logging=False,
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bridge_module, "setup_logging", lambda **kwargs: _NULL_LOGGER)
+        return ManimBridge(config=config)
+
+
+@pytest.fixture(scope="session")
+def _shared_root(tmp_path_factory):
+    """One parent dir per session (and per xdist worker) for every test's workspace"""
+    return tmp_path_factory.mktemp("bridge_shared")
+
+
+@pytest.fixture(scope="session")
+def _sample_video(tmp_path_factory):
+    """Write the fake video payload once; tests only ever read it"""
+    sample = tmp_path_factory.mktemp("sample_video") / "sample.mp4"
+    sample.write_bytes(b"fake video data" * 1000)
+    return sample
 
 
 class TestManimBridgeComprehensive:
     """Comprehensive test cases for ManimBridge"""
 
     @pytest.fixture
-    def mock_config(self, tmp_path):
-        """Create a mock configuration"""
-        source_dir = tmp_path / "source"
-        target_dir = tmp_path / "target"
+    def mock_config(self, _bridge_template, _shared_root):
+        """Point a copy of the template config at a fresh subdir of the shared root"""
+        root = Path(tempfile.mkdtemp(prefix="t", dir=_shared_root))
+        source_dir = root / "source"
         source_dir.mkdir()
-        target_dir.mkdir()
 
-        config = BridgeConfig(
+        # replace() reruns __post_init__, which resolves the paths, derives
+        # allowed_dirs again and creates target_dir
+        return dataclasses.replace(
+            _bridge_template.config,
             source_dir=source_dir,
-            target_dir=target_dir,
-            manifest_file=tmp_path / "manifest.json",
-            max_workers=2,
-            enable_dev_logging=False,
+            target_dir=root / "target",
+            manifest_file=root / "manifest.json",
+            allowed_dirs=None,
         )
-        return config
 
     @pytest.fixture
-    def bridge(self, mock_config):
-        """Create a bridge instance with mock config"""
-        with patch("manim_bridge.bridge.setup_logging"):
-            bridge = ManimBridge(config=mock_config)
-            return bridge
+    def bridge(self, _bridge_template, mock_config):
+        """Copy the session bridge onto mock_config with a stubbed manifest and fresh metrics"""
+        bridge = copy.copy(_bridge_template)
+        bridge.config = mock_config
+        bridge.path_validator = PathValidator(mock_config.allowed_dirs)
+        bridge.manifest_handler = _StubManifestHandler()
+        bridge.metrics = PerformanceMonitor(enabled=mock_config.log_performance)
+        bridge.observer = None
+        return bridge
 
-    def test_process_file_with_valid_video(self, bridge, tmp_path):
-        """Test processing a valid video file"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"fake video data" * 1000)
+    @pytest.fixture
+    def make_videos(self, bridge, _sample_video):
+        """Return a factory that links the session sample video into the source dir"""
 
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge.path_validator, "is_safe", return_value=True):
-                    with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                        with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                            # Create a mock video info object with required attributes
-                            mock_video_info = Mock()
-                            mock_video_info.hash = "abc123"
-                            mock_video_info.scene_name = "TestScene"
-                            mock_video_info.quality = "1080p"
-                            mock_video_info.size = 15000
-                            mock_video_info.duration = 30.5
-                            mock_video_info.codec = "h264"
-                            mock_meta.return_value = mock_video_info
-
-                            with patch.object(
-                                bridge.manifest_handler, "needs_processing", return_value=True
-                            ):
-                                with patch.object(
-                                    bridge.video_processor,
-                                    "generate_output_filename",
-                                    return_value="TestScene_1080p_20240115.mp4",
-                                ):
-                                    with patch.object(
-                                        bridge.file_operations, "atomic_copy", return_value=True
-                                    ):
-                                        # Disable symlink and index creation to avoid errors
-                                        bridge.config.create_latest_symlink = False
-                                        bridge.config.update_index = False
-                                        with patch.object(bridge.manifest_handler, "add_entry"):
-                                            # Also need to patch update_video_index to prevent it from being called
-                                            with patch.object(bridge, "update_video_index"):
-                                                result = bridge.process_file(test_file)
-                                                # process_file returns bool, not dict
-                                                assert result is True
+        def make_videos(*names):
+            videos = [bridge.config.source_dir / name for name in names]
+            for video in videos:
+                try:
+                    os.link(_sample_video, video)
+                except OSError:
+                    shutil.copyfile(_sample_video, video)
+            return videos
+
+        return make_videos
+
+    @pytest.fixture
+    def video_file(self, make_videos):
+        """The session sample video linked into this test's source dir"""
+        return make_videos("test.mp4")[0]
+
+    @pytest.fixture
+    def happy_path(self, bridge, monkeypatch):
+        """Let any file through the type, exclusion, safety and write-complete checks"""
+        monkeypatch.setattr(bridge.video_processor, "is_video_file", lambda *_: True)
+        monkeypatch.setattr(bridge.video_processor, "is_excluded", lambda *_: False)
+        monkeypatch.setattr(bridge.path_validator, "is_safe", lambda *_: True)
+        monkeypatch.setattr(bridge, "_wait_for_file_complete", lambda *_: True)
+
+    @pytest.fixture
+    def video_info(self):
+        """Fresh copy of the video info prototype that a test may override fields on"""
+        return copy.copy(_VIDEO_INFO_PROTO)
+
+    @pytest.mark.parametrize("scenario", ["happy", "after_exception", "with_metrics"])
+    def test_process_file_with_valid_video(
+        self, bridge, happy_path, video_file, video_info, scenario
+    ):
+        """Test a valid video is processed from a clean or failed prior state"""
+        # Disable symlink and index creation to avoid errors
+        bridge.config.create_latest_symlink = False
+        bridge.config.update_index = False
+
+        with ExitStack() as stack:
+            mocks = _apply_patches(stack, bridge, VALID_PROCESSING_PATCHES)
+
+            if scenario == "after_exception":
+                mocks["extract_metadata"].side_effect = Exception("Unexpected error")
+                # process_file returns False on exceptions, not None
+                assert bridge.process_file(video_file) is False
+                mocks["extract_metadata"].side_effect = None
+
+            if scenario == "with_metrics":
+                # A MagicMock return value is already a context manager whose __exit__
+                # does not swallow exceptions
+                mock_measure = stack.enter_context(patch.object(bridge.metrics, "measure"))
+
+            mocks["extract_metadata"].return_value = video_info
+
+            # process_file returns bool, not dict
+            assert bridge.process_file(video_file) is True
+
+        if scenario == "with_metrics":
+            # Should use performance monitoring
+            assert mock_measure.called
+
+    def test_manifest_corruption_recovery(self, mock_config):
+        """Test a corrupted manifest reads back as empty instead of raising"""
+        mock_config.manifest_file.write_text("corrupted json{")
+
+        # ManifestHandler.read() catches JSONDecodeError and returns empty dict
+        assert ManifestHandler(mock_config.manifest_file).read() == {}
 
     def test_process_file_with_unsafe_path(self, bridge, tmp_path):
         """Test rejection of unsafe paths"""
@@ -93,157 +239,97 @@ class TestManimBridgeComprehensive:
             result = bridge.process_file(test_file)
             assert result is False
 
-    def test_process_file_already_processed(self, bridge, tmp_path):
+    def test_process_file_already_processed(
+        self, bridge, happy_path, video_file, video_info, monkeypatch
+    ):
         """Test skipping files already processed"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video content")
+        # File already processed
+        monkeypatch.setattr(bridge.manifest_handler, "needs_processing", lambda *_: False)
 
         with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-            mock_video_info = Mock()
-            mock_video_info.hash = "already_processed"
-            mock_meta.return_value = mock_video_info
+            video_info.hash = "already_processed"
+            mock_meta.return_value = video_info
 
-            # File already processed
-            with patch.object(bridge.manifest_handler, "needs_processing", return_value=False):
-                result = bridge.process_file(test_file)
-                assert result is False
+            result = bridge.process_file(video_file)
+            assert result is False
 
-    def test_scan_existing_files_with_errors(self, bridge):
+    def test_scan_existing_files_with_errors(self, bridge, make_videos, monkeypatch):
         """Test scan handling errors gracefully"""
         # Create some test files
-        video1 = bridge.config.source_dir / "video1.mp4"
-        video2 = bridge.config.source_dir / "video2.mp4"
-        video1.write_bytes(b"video 1")
-        video2.write_bytes(b"video 2")
+        videos = make_videos("video1.mp4", "video2.mp4")
 
-        with patch.object(bridge.video_processor, "find_videos") as mock_find:
-            mock_find.return_value = [video1, video2]
+        # First file succeeds, second fails
+        monkeypatch.setattr(bridge, "process_file", lambda path: path == videos[0])
 
-            with patch.object(bridge, "process_file") as mock_process:
-                # First file succeeds, second fails
-                mock_process.side_effect = [True, False]
+        with patch.object(bridge.video_processor, "find_videos") as mock_find:
+            mock_find.return_value = videos
 
-                result = bridge.scan_existing_files()
-                assert result == 1  # Only one succeeded
+            result = bridge.scan_existing_files()
+            assert result == 1  # Only one succeeded
 
     def test_stop_watching_method(self, bridge):
         """Test that stop_watching properly stops observer"""
-        # Setup mock observer
-        mock_observer = Mock()
-        mock_observer.is_alive.return_value = True
-        bridge.observer = mock_observer
+        observer = _FakeObserver()
+        bridge.observer = observer
 
         bridge.stop_watching()
 
-        mock_observer.stop.assert_called_once()
-        mock_observer.join.assert_called_once()
+        assert observer.stop.n == 1
+        assert observer.join.n == 1
 
-    def test_start_watching_method(self, bridge):
+    def test_start_watching_method(self, bridge, monkeypatch):
         """Test start_watching creates and starts observer"""
-        with patch("manim_bridge.bridge.Observer") as MockObserver:
-            mock_observer = MagicMock()
-            MockObserver.return_value = mock_observer
+        mock_observer = SimpleNamespace(schedule=Mock(), start=Mock())
+        MockObserver = Mock(return_value=mock_observer)
+        monkeypatch.setattr(bridge_module, "Observer", MockObserver)
 
-            bridge.start_watching()
+        bridge.start_watching()
 
-            # Should create and start observer
-            MockObserver.assert_called_once()
-            mock_observer.schedule.assert_called_once()
-            mock_observer.start.assert_called_once()
+        # Should create and start observer
+        MockObserver.assert_called_once()
+        mock_observer.schedule.assert_called_once()
+        mock_observer.start.assert_called_once()
 
     def test_run_method_with_keyboard_interrupt(self, bridge):
         """Test run method handles keyboard interrupt gracefully"""
         bridge.config.scan_on_start = True
 
+        def interrupt(seconds):
+            raise KeyboardInterrupt
+
         with patch.object(bridge, "scan_existing_files") as mock_scan:
             with patch.object(bridge, "start_watching") as mock_watch:
-                with patch("time.sleep", side_effect=KeyboardInterrupt):
-                    # Should not raise, but handle gracefully
-                    try:
-                        bridge.run(watch=True)
-                    except BridgeException:
-                        pass  # Wrapped in BridgeException
-
-    def test_handler_on_created_with_video_file(self, bridge):
-        """Test handler processes created video files"""
+                # Should not raise, but handle gracefully
+                try:
+                    bridge.run(watch=True, sleep=interrupt)
+                except BridgeException:
+                    pass  # Wrapped in BridgeException
+
+        mock_scan.assert_called_once()
+        mock_watch.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "event,should_process",
+        [(_VIDEO_EVENT, True), (_DIR_EVENT, False)],
+        ids=["video_file", "directory"],
+    )
+    def test_handler_on_created(self, bridge, event, should_process):
+        """Test handler processes created files and ignores created directories"""
         handler = ManimBridgeHandler(bridge)
 
         # Mock process_file
         bridge.process_file = Mock()
 
-        # Create event for video file
-        event = FileCreatedEvent(src_path=str(bridge.config.source_dir / "new.mp4"))
-        event.is_directory = False
-
         handler.on_created(event)
 
-        # Should process the file
-        bridge.process_file.assert_called_once()
+        if should_process:
+            bridge.process_file.assert_called_once_with(Path(event.src_path))
+        else:
+            bridge.process_file.assert_not_called()
 
-    def test_handler_ignores_directory_events(self, bridge):
-        """Test handler ignores directory creation"""
-        handler = ManimBridgeHandler(bridge)
-
-        # Mock process_file
-        bridge.process_file = Mock()
-
-        # Create event for directory
-        event = FileCreatedEvent(src_path=str(bridge.config.source_dir / "newdir"))
-        event.is_directory = True
-
-        handler.on_created(event)
-
-        # Should NOT process
-        bridge.process_file.assert_not_called()
-
-    def test_manifest_corruption_recovery(self, bridge):
-        """Test recovery from corrupted manifest"""
-        # Write corrupted manifest to test that ManifestHandler.read() handles JSONDecodeError
-        manifest_file = bridge.config.manifest_file
-        manifest_file.write_text("corrupted json{")
-
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video")
-
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge.path_validator, "is_safe", return_value=True):
-                    with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                        with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                            mock_video_info = Mock()
-                            mock_video_info.hash = "def456"
-                            mock_video_info.scene_name = "TestScene"
-                            mock_video_info.quality = "1080p"
-                            mock_video_info.size = 5
-                            mock_video_info.duration = 10.0
-                            mock_video_info.codec = "h264"
-                            mock_meta.return_value = mock_video_info
-
-                            with patch.object(
-                                bridge.manifest_handler, "needs_processing", return_value=True
-                            ):
-                                with patch.object(
-                                    bridge.video_processor,
-                                    "generate_output_filename",
-                                    return_value="test.mp4",
-                                ):
-                                    with patch.object(bridge.file_operations, "atomic_copy"):
-                                        # Disable config options that could cause failures
-                                        bridge.config.create_latest_symlink = False
-                                        bridge.config.update_index = False
-                                        with patch.object(bridge.manifest_handler, "add_entry"):
-                                            # Should handle the corrupted manifest and continue successfully
-                                            # ManifestHandler.read() catches JSONDecodeError and returns empty dict
-                                            result = bridge.process_file(test_file)
-                                            assert result is True
-
-    def test_concurrent_file_processing(self, bridge):
+    def test_concurrent_file_processing(self, bridge, make_videos):
         """Test handling multiple file processing"""
-        files = []
-        for i in range(3):
-            f = bridge.config.source_dir / f"video{i}.mp4"
-            f.write_bytes(f"video {i}".encode())
-            files.append(f)
+        files = make_videos(*(f"video{i}.mp4" for i in range(3)))
 
         with patch.object(bridge.video_processor, "find_videos") as mock_find:
             mock_find.return_value = files
@@ -255,217 +341,81 @@ class TestManimBridgeComprehensive:
                 assert mock_process.call_count == 3
                 assert result == 3
 
-    def test_performance_monitoring_integration(self, bridge):
-        """Test performance monitoring during processing"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video data")
-
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                    with patch.object(bridge.metrics, "measure") as mock_measure:
-                        # Setup context manager mock
-                        mock_context = MagicMock()
-                        mock_context.__enter__ = Mock(return_value=mock_context)
-                        mock_context.__exit__ = Mock(return_value=False)
-                        mock_measure.return_value = mock_context
-
-                        with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                            mock_video_info = Mock()
-                            mock_video_info.hash = "xyz789"
-                            mock_video_info.scene_name = "Test"
-                            mock_video_info.quality = "1080p"
-                            mock_video_info.size = 1000
-                            mock_video_info.duration = 15.0
-                            mock_video_info.codec = "h264"
-                            mock_meta.return_value = mock_video_info
-
-                            with patch.object(
-                                bridge.manifest_handler, "needs_processing", return_value=True
-                            ):
-                                with patch.object(
-                                    bridge.video_processor,
-                                    "generate_output_filename",
-                                    return_value="test.mp4",
-                                ):
-                                    with patch.object(bridge.file_operations, "atomic_copy"):
-                                        with patch.object(bridge.manifest_handler, "add_entry"):
-                                            bridge.process_file(test_file)
-
-                        # Should use performance monitoring
-                        assert mock_measure.called
-
-    def test_error_recovery_after_exception(self, bridge):
-        """Test bridge recovers after processing exception"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video")
-
-        # First call fails
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                    with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                        mock_meta.side_effect = Exception("Unexpected error")
-
-                        result1 = bridge.process_file(test_file)
-                        assert (
-                            result1 is False
-                        )  # process_file returns False on exceptions, not None
-
-        # Second call should work
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                    with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                        mock_video_info = Mock()
-                        mock_video_info.hash = "recovered"
-                        mock_video_info.scene_name = "TestScene"
-                        mock_video_info.quality = "1080p"
-                        mock_video_info.size = 5
-                        mock_video_info.duration = 10.0
-                        mock_video_info.codec = "h264"
-                        mock_meta.return_value = mock_video_info
-
-                        with patch.object(bridge.file_operations, "atomic_copy", return_value=True):
-                            with patch.object(
-                                bridge.manifest_handler, "needs_processing", return_value=True
-                            ):
-                                with patch.object(
-                                    bridge.video_processor,
-                                    "generate_output_filename",
-                                    return_value="test.mp4",
-                                ):
-                                    # Disable config options that could cause failures
-                                    bridge.config.create_latest_symlink = False
-                                    bridge.config.update_index = False
-                                    with patch.object(bridge.manifest_handler, "add_entry"):
-                                        with patch.object(bridge, "update_video_index"):
-                                            result2 = bridge.process_file(test_file)
-                                            # Should process successfully after recovery
-                                            assert result2 is True
-
-    def test_disk_full_handling(self, bridge):
+    def test_disk_full_handling(self, bridge, happy_path, video_file, video_info):
         """Test handling disk full errors"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video data")
-
         with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-            mock_video_info = Mock()
-            mock_video_info.hash = "full123"
-            mock_meta.return_value = mock_video_info
+            video_info.hash = "full123"
+            mock_meta.return_value = video_info
 
-            with patch.object(bridge.manifest_handler, "needs_processing", return_value=True):
-                with patch.object(bridge.file_operations, "atomic_copy") as mock_copy:
-                    mock_copy.side_effect = OSError("No space left on device")
+            with patch.object(bridge.file_operations, "atomic_copy") as mock_copy:
+                mock_copy.side_effect = OSError("No space left on device")
 
-                    # Should handle gracefully
-                    result = bridge.process_file(test_file)
-                    assert result is False
+                # Should handle gracefully
+                result = bridge.process_file(video_file)
+                assert result is False
 
-    def test_symlink_creation_error_handling(self, bridge):
+    def test_symlink_creation_error_handling(self, bridge, happy_path, video_file, video_info):
         """Test handling symlink creation errors"""
         bridge.config.create_latest_symlink = True  # Enable symlinks to test error handling
         bridge.config.update_index = False  # Disable index to avoid other issues
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video")
 
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge.path_validator, "is_safe", return_value=True):
-                    with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                        with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                            mock_video_info = Mock()
-                            mock_video_info.hash = "sym123"
-                            mock_video_info.scene_name = "TestScene"
-                            mock_video_info.quality = "1080p"
-                            mock_video_info.size = 5
-                            mock_video_info.duration = 10.0
-                            mock_video_info.codec = "h264"
-                            mock_meta.return_value = mock_video_info
-
-                            with patch.object(
-                                bridge.manifest_handler, "needs_processing", return_value=True
-                            ):
-                                with patch.object(
-                                    bridge.video_processor,
-                                    "generate_output_filename",
-                                    return_value="test.mp4",
-                                ):
-                                    with patch.object(
-                                        bridge.file_operations, "atomic_copy", return_value=True
-                                    ):
-                                        with patch.object(
-                                            bridge.file_operations, "safe_symlink"
-                                        ) as mock_symlink:
-                                            # Make safe_symlink raise ProcessingError (what it actually does)
-                                            from manim_bridge.core.exceptions import ProcessingError
-
-                                            mock_symlink.side_effect = ProcessingError(
-                                                "Cannot create symlink"
-                                            )
-                                            with patch.object(bridge.manifest_handler, "add_entry"):
-                                                # Should fail because symlink errors bubble up (ProcessingError not caught)
-                                                result = bridge.process_file(test_file)
-                                                # Current implementation: symlink errors cause processing to fail
-                                                assert result is False
-
-    def test_update_video_index_with_errors(self, bridge):
+        video_info.hash = "sym123"
+
+        with ExitStack() as stack:
+            mocks = _apply_patches(stack, bridge, VALID_PROCESSING_PATCHES)
+            mocks["extract_metadata"].return_value = video_info
+            mock_symlink = stack.enter_context(
+                patch.object(bridge.file_operations, "safe_symlink")
+            )
+            # Make safe_symlink raise ProcessingError (what it actually does)
+            mock_symlink.side_effect = ProcessingError("Cannot create symlink")
+
+            # Should fail because symlink errors bubble up (ProcessingError not caught)
+            result = bridge.process_file(video_file)
+            # Current implementation: symlink errors cause processing to fail
+            assert result is False
+
+    def test_update_video_index_with_errors(self, bridge, monkeypatch):
         """Test video index update error handling"""
         # Create a video file in target dir
         video_file = bridge.config.target_dir / "test.mp4"
         video_file.write_bytes(b"video")
 
-        with patch("builtins.open", side_effect=PermissionError("Cannot write index")):
-            # Should handle error gracefully
-            bridge.update_video_index()
-            # Should log error but not crash
+        def raising_open(*args, **kwargs):
+            raise PermissionError("Cannot write index")
+
+        # Shadow open() inside the bridge module only, leaving builtins untouched
+        monkeypatch.setattr("manim_bridge.bridge.open", raising_open, raising=False)
+
+        # Should handle error gracefully
+        bridge.update_video_index()
+        # Should log error but not crash
+        assert not (bridge.config.target_dir / "index.json").exists()
 
-    def test_manifest_save_error_handling(self, bridge):
+    def test_manifest_save_error_handling(
+        self, bridge, happy_path, video_file, video_info, monkeypatch
+    ):
         """Test handling manifest save errors"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video")
+        video_info.hash = "save123"
 
-        with patch.object(bridge.video_processor, "is_video_file", return_value=True):
-            with patch.object(bridge.video_processor, "is_excluded", return_value=False):
-                with patch.object(bridge, "_wait_for_file_complete", return_value=True):
-                    with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                        mock_video_info = Mock()
-                        mock_video_info.hash = "save123"
-                        mock_video_info.scene_name = "TestScene"
-                        mock_video_info.quality = "1080p"
-                        mock_video_info.size = 5
-                        mock_video_info.duration = 10.0
-                        mock_video_info.codec = "h264"
-                        mock_meta.return_value = mock_video_info
-
-                        with patch.object(
-                            bridge.manifest_handler, "needs_processing", return_value=True
-                        ):
-                            with patch.object(
-                                bridge.video_processor,
-                                "generate_output_filename",
-                                return_value="test.mp4",
-                            ):
-                                with patch.object(bridge.file_operations, "atomic_copy"):
-                                    with patch.object(
-                                        bridge.manifest_handler, "add_entry"
-                                    ) as mock_add:
-                                        mock_add.side_effect = Exception("Cannot save manifest")
-
-                                        # Should handle error and return False (exception caught)
-                                        result = bridge.process_file(test_file)
-                                        assert (
-                                            result is False
-                                        )  # process_file returns False on exceptions, not None
-
-    def test_validate_video_timeout(self, bridge):
-        """Test handling video validation timeout"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"video")
+        def failing_add_entry(*args, **kwargs):
+            raise Exception("Cannot save manifest")
 
+        monkeypatch.setattr(bridge.manifest_handler, "add_entry", failing_add_entry)
+
+        with ExitStack() as stack:
+            mocks = _apply_patches(stack, bridge, VALID_PROCESSING_PATCHES)
+            mocks["extract_metadata"].return_value = video_info
+
+            # Should handle error and return False (exception caught)
+            result = bridge.process_file(video_file)
+            assert result is False  # process_file returns False on exceptions, not None
+
+    def test_validate_video_timeout(self, bridge, video_file):
+        """Test handling video validation timeout"""
         with patch.object(bridge.video_processor, "validate_video", return_value=False):
             # Should reject invalid video
-            result = bridge.process_file(test_file)
+            result = bridge.process_file(video_file)
             # Validation happens in _wait_for_file_complete
             assert result is None or result is False
 
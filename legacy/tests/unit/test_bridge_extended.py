@@ -1,12 +1,16 @@
 """Extended tests for the ManimBridge class focusing on edge cases and error handling"""
 
+import filecmp
 import json
+import shutil
 import time
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from watchdog.events import FileCreatedEvent, FileModifiedEvent
+from watchdog.observers import Observer
 
 from manim_bridge.bridge import ManimBridge, ManimBridgeHandler
 from manim_bridge.core.config import BridgeConfig
@@ -14,35 +18,104 @@ from manim_bridge.core.exceptions import (
     ProcessingError,
     SecurityError,
 )
-from manim_bridge.processing.video_processor import VideoInfo
+from manim_bridge.processing.video_processor import VideoInfo, VideoProcessor
+
+
+# process_file only reads fields off the metadata, so every test shares one instance
+_FAKE_VIDEO_INFO = VideoInfo(
+    path=Path("/placeholder.mp4"),
+    hash="abc123",
+    scene_name="test",
+    quality="high",
+    size=1000,
+    duration=10,
+    codec="h264",
+)
+
+
+def _interrupt(seconds):
+    """Sleep stand-in that stops ManimBridge.run() the way Ctrl+C does"""
+    raise KeyboardInterrupt
+
+
+def _running_observer():
+    """Observer double limited to the real Observer API that reports itself alive"""
+    observer = Mock(spec_set=Observer)
+    observer.configure_mock(**{"is_alive.return_value": True})
+    return observer
+
+
+@pytest.fixture(scope="module")
+def mock_config(tmp_path_factory):
+    """Create a mock configuration shared by the module"""
+    workspace = tmp_path_factory.mktemp("bridge")
+    source_dir = workspace / "source"
+    target_dir = workspace / "target"
+    source_dir.mkdir()
+    target_dir.mkdir()
+
+    config = BridgeConfig(
+        source_dir=source_dir,
+        target_dir=target_dir,
+        manifest_file=workspace / "manifest.json",
+        max_workers=2,
+        enable_dev_logging=False,
+    )
+    return config
+
+
+@pytest.fixture(scope="module")
+def _module_bridge(mock_config):
+    """Build one bridge with mock config for the whole module"""
+    with patch("manim_bridge.bridge.setup_logging"):
+        return ManimBridge(config=mock_config)
 
 
 class TestManimBridgeEdgeCases:
     """Test edge cases and error conditions for ManimBridge"""
 
     @pytest.fixture
-    def mock_config(self, tmp_path):
-        """Create a mock configuration"""
-        source_dir = tmp_path / "source"
-        target_dir = tmp_path / "target"
-        source_dir.mkdir()
-        target_dir.mkdir()
+    def bridge(self, _module_bridge):
+        """Provide the shared bridge with state left by earlier tests reset"""
+        bridge = _module_bridge
 
-        config = BridgeConfig(
-            source_dir=source_dir,
-            target_dir=target_dir,
-            manifest_file=tmp_path / "manifest.json",
-            max_workers=2,
-            enable_dev_logging=False,
+        # Drop methods replaced on the instance by earlier tests
+        vars(bridge).pop("process_file", None)
+        bridge.observer = None
+        bridge.config.scan_on_start = True
+
+        for directory in (bridge.config.source_dir, bridge.config.target_dir):
+            shutil.rmtree(directory)
+            directory.mkdir()
+
+        return bridge
+
+    @pytest.fixture
+    def video_processor(self, bridge, monkeypatch):
+        """Swap in a VideoProcessor double that treats every file as a wanted video"""
+        video_processor = Mock(spec_set=VideoProcessor)
+        video_processor.configure_mock(
+            **{
+                "is_video_file.return_value": True,
+                "is_excluded.return_value": False,
+                "extract_metadata.return_value": _FAKE_VIDEO_INFO,
+                "generate_output_filename.return_value": "test_output.mp4",
+            }
         )
-        return config
+        monkeypatch.setattr(bridge, "video_processor", video_processor)
+        return video_processor
 
     @pytest.fixture
-    def bridge(self, mock_config):
-        """Create a bridge instance with mock config"""
-        with patch("manim_bridge.bridge.setup_logging"):
-            bridge = ManimBridge(config=mock_config)
-            return bridge
+    def happy_path_bridge(self, bridge, video_processor, monkeypatch):
+        """Bridge whose collaborators carry any file through process_file successfully"""
+        monkeypatch.setattr(bridge, "_wait_for_file_complete", lambda path: True)
+        monkeypatch.setattr(bridge.manifest_handler, "needs_processing", lambda *args: True)
+        # Mock rather than lambda so tests can assert the manifest was updated
+        monkeypatch.setattr(bridge.manifest_handler, "add_entry", Mock())
+        monkeypatch.setattr(bridge.file_operations, "atomic_copy", lambda *args: True)
+        monkeypatch.setattr(bridge.file_operations, "safe_symlink", lambda *args: True)
+        monkeypatch.setattr(bridge, "update_video_index", lambda: None)
+        return bridge
 
     def test_bridge_initialization_with_invalid_config(self, tmp_path):
         """Test bridge initialization with non-existent directories"""
@@ -112,69 +185,47 @@ class TestManimBridgeEdgeCases:
         """Test processing a file with invalid extension"""
         # Create a test file with non-video extension
         test_file = tmp_path / "test.txt"
-        test_file.write_text("not a video")
+        test_file.touch()
 
         # Should skip non-video files and return False
         result = bridge.process_file(test_file)
         assert result is False
 
-    def test_process_file_already_processing(self, bridge, tmp_path):
+    def test_process_file_already_processing(self, bridge, video_processor, tmp_path):
         """Test that files already processed are skipped"""
         test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"fake video data")
+        test_file.touch()
 
         # Mock already processed file via manifest
         with patch.object(bridge.manifest_handler, "needs_processing") as mock_needs:
             mock_needs.return_value = False  # Already processed
 
-            with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-                mock_is_video.return_value = True
-
-                with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                    mock_excluded.return_value = False
-
-                    with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                        mock_meta.return_value = Mock(hash="abc123")
+            # Should skip file already processed
+            result = bridge.process_file(test_file)
+            assert result is False
 
-                        # Should skip file already processed
-                        result = bridge.process_file(test_file)
-                        assert result is False
-
-    def test_process_file_security_error(self, bridge, tmp_path):
+    def test_process_file_security_error(self, bridge, video_processor, tmp_path):
         """Test handling of security errors during file processing"""
         test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"fake video data")
+        test_file.touch()
 
         with patch.object(bridge.path_validator, "is_safe") as mock_safe:
             mock_safe.return_value = False  # Simulate unsafe path
 
-            with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-                mock_is_video.return_value = True
-
-                with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                    mock_excluded.return_value = False
+            # Should handle security error gracefully
+            result = bridge.process_file(test_file)
+            assert result is False
 
-                    # Should handle security error gracefully
-                    result = bridge.process_file(test_file)
-                    assert result is False
-
-    def test_process_file_processing_error(self, bridge, tmp_path):
+    def test_process_file_processing_error(self, bridge, video_processor, tmp_path):
         """Test handling of processing errors"""
         test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"fake video data")
-
-        with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-            mock_is_video.return_value = True
+        test_file.touch()
 
-            with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                mock_excluded.return_value = False
+        video_processor.extract_metadata.side_effect = ProcessingError("Video error")
 
-                with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                    mock_meta.side_effect = ProcessingError("Video error")
-
-                    # Should handle processing error gracefully
-                    result = bridge.process_file(test_file)
-                    assert result is False
+        # Should handle processing error gracefully
+        result = bridge.process_file(test_file)
+        assert result is False
 
     def test_scan_existing_files_empty_directory(self, bridge):
         """Test scanning an empty directory"""
@@ -188,8 +239,8 @@ class TestManimBridgeEdgeCases:
         # Create some test video files
         video1 = bridge.config.source_dir / "video1.mp4"
         video2 = bridge.config.source_dir / "video2.mp4"
-        video1.write_bytes(b"fake video 1")
-        video2.write_bytes(b"fake video 2")
+        video1.touch()
+        video2.touch()
 
         with patch.object(bridge, "process_file") as mock_process:
             mock_process.return_value = {"status": "success"}
@@ -200,11 +251,8 @@ class TestManimBridgeEdgeCases:
 
     def test_watch_directory_stop_event(self, bridge):
         """Test start_watching and stop_watching methods"""
-        with patch("manim_bridge.bridge.Observer") as MockObserver:
-            mock_observer = MagicMock()
-            MockObserver.return_value = mock_observer
-            mock_observer.is_alive.return_value = True
-
+        mock_observer = _running_observer()
+        with patch("manim_bridge.bridge.Observer", return_value=mock_observer):
             # Start watching
             bridge.start_watching()
 
@@ -228,12 +276,8 @@ class TestManimBridgeEdgeCases:
                 with patch.object(bridge, "stop_watching") as mock_stop:
                     mock_scan.return_value = 5
 
-                    # Mock KeyboardInterrupt to exit the infinite loop
-                    with patch("time.sleep", side_effect=KeyboardInterrupt):
-                        try:
-                            bridge.run(watch=True)
-                        except KeyboardInterrupt:
-                            pass
+                    # Interrupt the watch loop on its first sleep
+                    bridge.run(watch=True, sleep=_interrupt)
 
                     mock_scan.assert_called_once()
                     mock_start.assert_called_once()
@@ -247,12 +291,8 @@ class TestManimBridgeEdgeCases:
         with patch.object(bridge, "scan_existing_files") as mock_scan:
             with patch.object(bridge, "start_watching") as mock_start:
                 with patch.object(bridge, "stop_watching") as mock_stop:
-                    # Mock KeyboardInterrupt to exit the infinite loop
-                    with patch("time.sleep", side_effect=KeyboardInterrupt):
-                        try:
-                            bridge.run(watch=True)
-                        except KeyboardInterrupt:
-                            pass
+                    # Interrupt the watch loop on its first sleep
+                    bridge.run(watch=True, sleep=_interrupt)
 
                     mock_scan.assert_not_called()
                     mock_start.assert_called_once()
@@ -260,11 +300,8 @@ class TestManimBridgeEdgeCases:
 
     def test_stop_method(self, bridge):
         """Test stop_watching method"""
-        with patch("manim_bridge.bridge.Observer") as MockObserver:
-            mock_observer = MagicMock()
-            MockObserver.return_value = mock_observer
-            mock_observer.is_alive.return_value = True
-
+        mock_observer = _running_observer()
+        with patch("manim_bridge.bridge.Observer", return_value=mock_observer):
             # Start watching first
             bridge.start_watching()
 
@@ -275,253 +312,58 @@ class TestManimBridgeEdgeCases:
             mock_observer.stop.assert_called_once()
             mock_observer.join.assert_called_once()
 
-    def test_concurrent_file_processing(self, bridge, tmp_path):
-        """Test concurrent processing of multiple files"""
+    def test_batch_file_processing(self, happy_path_bridge):
+        """Test processing a batch of files back to back"""
+        bridge = happy_path_bridge
+
         # Create multiple test files
         files = []
         for i in range(5):
             file = bridge.config.source_dir / f"video{i}.mp4"
-            file.write_bytes(f"fake video {i}".encode())
+            file.touch()
             files.append(file)
 
-        with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-            mock_is_video.return_value = True
-
-            with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                mock_excluded.return_value = False
-
-                with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                    mock_meta.return_value = VideoInfo(
-                        path=files[0],
-                        hash="abc123",
-                        scene_name="test",
-                        quality="high",
-                        size=1000,
-                        duration=10,
-                        codec="h264",
-                    )
-
-                    with patch.object(bridge.manifest_handler, "needs_processing") as mock_needs:
-                        mock_needs.return_value = True
-
-                        with patch.object(bridge.file_operations, "atomic_copy") as mock_copy:
-                            mock_copy.return_value = True
-
-                            with patch.object(bridge, "_wait_for_file_complete") as mock_wait:
-                                mock_wait.return_value = True
-
-                                with patch.object(
-                                    bridge.video_processor, "generate_output_filename"
-                                ) as mock_gen:
-                                    mock_gen.return_value = "test_output.mp4"
-
-                                    with patch.object(
-                                        bridge.manifest_handler, "add_entry"
-                                    ) as mock_add:
-                                        with patch.object(
-                                            bridge, "update_video_index"
-                                        ) as mock_update:
-                                            with patch.object(
-                                                bridge.file_operations, "safe_symlink"
-                                            ) as mock_symlink:
-                                                mock_symlink.return_value = True
-
-                                                # Process files concurrently
-                                                from concurrent.futures import ThreadPoolExecutor
-
-                                                with ThreadPoolExecutor(max_workers=3) as executor:
-                                                    futures = [
-                                                        executor.submit(bridge.process_file, f)
-                                                        for f in files
-                                                    ]
-                                                    results = [f.result() for f in futures]
-
-                                                # All files should be processed successfully
-                                                assert len([r for r in results if r is True]) == 5
-
-    def test_manifest_update_on_successful_processing(self, bridge, tmp_path):
-        """Test that manifest is updated after successful processing"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"fake video data")
-
-        with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-            mock_is_video.return_value = True
-
-            with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                mock_excluded.return_value = False
-
-                with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                    mock_meta.return_value = VideoInfo(
-                        path=test_file,
-                        hash="abc123",
-                        scene_name="test",
-                        quality="high",
-                        size=1000,
-                        duration=10,
-                        codec="h264",
-                    )
-
-                    with patch.object(bridge.manifest_handler, "needs_processing") as mock_needs:
-                        mock_needs.return_value = True
-
-                        with patch.object(bridge.file_operations, "atomic_copy") as mock_copy:
-                            mock_copy.return_value = True
-
-                            with patch.object(bridge, "_wait_for_file_complete") as mock_wait:
-                                mock_wait.return_value = True
-
-                                with patch.object(
-                                    bridge.video_processor, "generate_output_filename"
-                                ) as mock_gen:
-                                    mock_gen.return_value = "test_output.mp4"
-
-                                    with patch.object(
-                                        bridge.manifest_handler, "add_entry"
-                                    ) as mock_add:
-                                        with patch.object(
-                                            bridge, "update_video_index"
-                                        ) as mock_update:
-                                            with patch.object(
-                                                bridge.file_operations, "safe_symlink"
-                                            ) as mock_symlink:
-                                                mock_symlink.return_value = True
-
-                                                result = bridge.process_file(test_file)
-
-                                                # Manifest should be updated
-                                                mock_add.assert_called_once()
-                                                assert result is True
-
-    def test_performance_monitoring_integration(self, bridge, tmp_path):
-        """Test performance monitoring during processing"""
-        test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"fake video data")
-
-        with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-            mock_is_video.return_value = True
-
-            with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                mock_excluded.return_value = False
+        # Every collaborator is stubbed, so there is nothing for threads to overlap
+        results = [bridge.process_file(f) for f in files]
 
-                with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                    mock_meta.return_value = VideoInfo(
-                        path=test_file,
-                        hash="abc123",
-                        scene_name="test",
-                        quality="high",
-                        size=1000,
-                        duration=10,
-                        codec="h264",
-                    )
+        # All files should be processed successfully
+        assert sum(1 for r in results if r is True) == 5
 
-                    with patch.object(bridge.manifest_handler, "needs_processing") as mock_needs:
-                        mock_needs.return_value = True
-
-                        with patch.object(bridge.file_operations, "atomic_copy") as mock_copy:
-                            mock_copy.return_value = True
-
-                            with patch.object(bridge, "_wait_for_file_complete") as mock_wait:
-                                mock_wait.return_value = True
-
-                                with patch.object(bridge.metrics, "measure") as mock_measure:
-
-                                    def measure_context(name):
-                                        class MockContext:
-                                            def __enter__(self):
-                                                return self
-
-                                            def __exit__(self, exc_type, exc_val, exc_tb):
-                                                pass
-
-                                        return MockContext()
-
-                                    mock_measure.return_value = measure_context("test")
-
-                                    with patch.object(
-                                        bridge.video_processor, "generate_output_filename"
-                                    ) as mock_gen:
-                                        mock_gen.return_value = "test_output.mp4"
+    def test_successful_processing_updates_manifest_and_metrics(
+        self, happy_path_bridge, monkeypatch
+    ):
+        """Test that a successful run updates the manifest and is measured"""
+        bridge = happy_path_bridge
+        test_file = bridge.config.source_dir / "test.mp4"
+        test_file.touch()
 
-                                        with patch.object(
-                                            bridge.manifest_handler, "add_entry"
-                                        ) as mock_add:
-                                            with patch.object(
-                                                bridge, "update_video_index"
-                                            ) as mock_update:
-                                                with patch.object(
-                                                    bridge.file_operations, "safe_symlink"
-                                                ) as mock_symlink:
-                                                    mock_symlink.return_value = True
+        mock_measure = Mock(return_value=nullcontext())
+        monkeypatch.setattr(bridge.metrics, "measure", mock_measure)
 
-                                                    result = bridge.process_file(test_file)
+        result = bridge.process_file(test_file)
 
-                                                    # Performance metrics should be used
-                                                    assert mock_measure.called
-                                                    assert result is True
+        assert result is True
+        # Manifest should be updated
+        bridge.manifest_handler.add_entry.assert_called_once()
+        # Performance metrics should be used
+        assert mock_measure.called
 
-    def test_error_recovery_after_exception(self, bridge, tmp_path):
+    def test_error_recovery_after_exception(self, happy_path_bridge, video_processor):
         """Test that bridge recovers after an exception"""
+        bridge = happy_path_bridge
         test_file = bridge.config.source_dir / "test.mp4"
-        test_file.write_bytes(b"fake video data")
+        test_file.touch()
 
         # First call raises an exception
-        with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-            mock_is_video.return_value = True
-
-            with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                mock_excluded.return_value = False
+        video_processor.extract_metadata.side_effect = Exception("Unexpected error")
 
-                with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                    mock_meta.side_effect = Exception("Unexpected error")
-
-                    result1 = bridge.process_file(test_file)
-                    assert result1 is False
+        result1 = bridge.process_file(test_file)
+        assert result1 is False
 
         # Second call should work normally
-        with patch.object(bridge.video_processor, "is_video_file") as mock_is_video:
-            mock_is_video.return_value = True
-
-            with patch.object(bridge.video_processor, "is_excluded") as mock_excluded:
-                mock_excluded.return_value = False
-
-                with patch.object(bridge.video_processor, "extract_metadata") as mock_meta:
-                    mock_meta.return_value = VideoInfo(
-                        path=test_file,
-                        hash="abc123",
-                        scene_name="test",
-                        quality="high",
-                        size=1000,
-                        duration=10,
-                        codec="h264",
-                    )
-
-                    with patch.object(bridge.manifest_handler, "needs_processing") as mock_needs:
-                        mock_needs.return_value = True
-
-                        with patch.object(bridge.file_operations, "atomic_copy") as mock_copy:
-                            mock_copy.return_value = True
-
-                            with patch.object(bridge, "_wait_for_file_complete") as mock_wait:
-                                mock_wait.return_value = True
-
-                                with patch.object(
-                                    bridge.video_processor, "generate_output_filename"
-                                ) as mock_gen:
-                                    mock_gen.return_value = "test_output.mp4"
-
-                                    with patch.object(
-                                        bridge.manifest_handler, "add_entry"
-                                    ) as mock_add:
-                                        with patch.object(
-                                            bridge, "update_video_index"
-                                        ) as mock_update:
-                                            with patch.object(
-                                                bridge.file_operations, "safe_symlink"
-                                            ) as mock_symlink:
-                                                mock_symlink.return_value = True
-
-                                                result2 = bridge.process_file(test_file)
-                                                assert result2 is True
+        video_processor.extract_metadata.side_effect = None
+        result2 = bridge.process_file(test_file)
+        assert result2 is True
 
 
 class TestManimBridgeIntegration:
@@ -551,24 +393,29 @@ class TestManimBridgeIntegration:
         """Test the complete processing pipeline with a mock video file"""
         # Create a test video file
         test_file = integration_bridge.config.source_dir / "test_video.mp4"
-        test_file.write_bytes(b"FAKE_VIDEO_DATA" * 1000)  # Create some content
+        # An MP4 signature so the real validate_video accepts it, then some content
+        test_file.write_bytes(b"\x00\x00\x00\x18ftypmp42" + b"FAKE_VIDEO_DATA" * 1000)
 
         with patch.object(integration_bridge.video_processor, "extract_metadata") as mock_meta:
-            mock_meta.return_value = {
-                "duration": 30.5,
-                "width": 1920,
-                "height": 1080,
-                "fps": 30,
-            }
+            mock_meta.return_value = VideoInfo(
+                path=test_file,
+                hash="pipeline123",
+                scene_name="PipelineScene",
+                quality="1080p",
+                size=test_file.stat().st_size,
+                duration=30.5,
+                codec="h264",
+            )
 
             # Process the file
             result = integration_bridge.process_file(test_file)
 
-            if result:
-                # Check that file was copied to target
-                target_file = integration_bridge.config.target_dir / "test_video.mp4"
-                assert target_file.exists()
-                assert target_file.read_bytes() == test_file.read_bytes()
+        assert result is True
+
+        # The copy is named <scene>_<quality>_<timestamp>; the glob skips the _latest symlink
+        copies = list(integration_bridge.config.target_dir.glob("PipelineScene_1080p_*.mp4"))
+        assert len(copies) == 1
+        assert filecmp.cmp(copies[0], test_file, shallow=False)
 
     def test_manifest_persistence(self, integration_bridge):
         """Test that manifest data persists across bridge instances"""
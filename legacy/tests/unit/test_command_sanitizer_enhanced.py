@@ -50,6 +50,23 @@ class TestCommandSanitizerInitialization:
         ]
         assert CommandSanitizer.DANGEROUS_PATTERNS == expected_patterns
 
+    def test_dangerous_patterns_compiled_union(self):
+        """Test that the precompiled union matches exactly what the patterns match."""
+        samples = [
+            "$(evil)",
+            "`evil`",
+            "> /dev/null",
+            "RM -RF /",
+            "safe_command",
+            "single ` backtick",
+        ]
+        for sample in samples:
+            expected = any(
+                re.search(pattern, sample, re.IGNORECASE)
+                for pattern in CommandSanitizer.DANGEROUS_PATTERNS
+            )
+            assert bool(CommandSanitizer._DANGEROUS_RE.search(sample)) is expected
+
 
 @pytest.mark.unit
 @pytest.mark.security
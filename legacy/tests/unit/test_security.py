@@ -31,6 +31,114 @@ class TestPathValidator:
 
         assert validator.logger is None
 
+    def test_allowed_dirs_are_immutable(self, temp_workspace):
+        """Test allowed directories are published as an immutable snapshot."""
+        allowed_dirs = [temp_workspace / "source", temp_workspace / "target"]
+        validator = PathValidator(allowed_dirs)
+
+        assert isinstance(validator.allowed_dirs, tuple)
+
+        # Mutating the caller's list must not leak into the validator
+        allowed_dirs.append(temp_workspace / "extra")
+        assert len(validator.allowed_dirs) == 2
+        assert validator.is_safe(str(temp_workspace / "source" / "video.mp4")) is True
+        assert validator.is_safe(str(temp_workspace / "extra" / "video.mp4")) is False
+        assert validator.is_within_sandbox(temp_workspace / "extra" / "video.mp4") is False
+
+    def test_sibling_prefix_not_allowed(self, temp_workspace):
+        """Test that a sibling sharing a name prefix is not treated as allowed."""
+        allowed_dir = temp_workspace / "allowed"
+        sibling_dir = temp_workspace / "allowed_evil"
+        allowed_dir.mkdir()
+        sibling_dir.mkdir()
+        validator = PathValidator([allowed_dir])
+
+        assert validator.is_safe(str(allowed_dir)) is True
+        assert validator.is_safe(str(sibling_dir / "video.mp4")) is False
+        assert validator.is_within_sandbox(sibling_dir / "video.mp4") is False
+
+    def test_syntactic_rejection_before_resolve(self, temp_workspace):
+        """Test that syntactically unsafe input is rejected without resolving."""
+        allowed_dir = temp_workspace / "allowed"
+        allowed_dir.mkdir()
+        validator = PathValidator([allowed_dir])
+
+        unsafe_inputs = [
+            str(allowed_dir / "video\x00.mp4"),
+            str(allowed_dir / "video\n.mp4"),
+            str(allowed_dir / "%2e%2e%2fetc%2fpasswd"),
+            str(allowed_dir / "..%c0%afetc"),
+            str(allowed_dir / ("\u202e" + "4pm.exe")),
+        ]
+
+        with patch.object(Path, "resolve") as mock_resolve:
+            for unsafe in unsafe_inputs:
+                assert validator.is_safe(unsafe) is False
+            mock_resolve.assert_not_called()
+
+        # Parent references that resolve back inside the sandbox remain allowed
+        assert validator.is_safe(str(allowed_dir / "sub" / ".." / "video.mp4")) is True
+
+    def test_shell_metacharacters_in_names_allowed(self, temp_workspace):
+        """Test that legal names containing shell metacharacters are accepted."""
+        allowed_dir = temp_workspace / "R&D$" / "source"
+        allowed_dir.mkdir(parents=True)
+        validator = PathValidator([allowed_dir])
+
+        for name in ["Tom & Jerry.mp4", "Q&A.mp4", "Price$5.mp4", "a;b.mp4", "drop table.mp4"]:
+            assert validator.is_safe(str(allowed_dir / name)) is True
+            assert validator.is_within_sandbox(allowed_dir / name) is True
+
+    def test_device_paths_rejected_before_resolve(self, temp_workspace):
+        """Test that device paths and reserved names are rejected by lookup."""
+        allowed_dir = temp_workspace / "allowed"
+        allowed_dir.mkdir()
+        validator = PathValidator([allowed_dir])
+
+        device_inputs = ["/dev/null", "/proc/self/mem", "/sys/kernel", str(allowed_dir / "con.mp4")]
+        with patch.object(Path, "resolve") as mock_resolve:
+            for device in device_inputs:
+                assert validator.is_safe(device) is False
+            mock_resolve.assert_not_called()
+
+        # Names that merely start with a reserved name are ordinary files
+        assert validator.is_safe(str(allowed_dir / "Console.mp4")) is True
+        assert validator.is_safe(str(allowed_dir / "COM10.mp4")) is True
+
+    def test_symlink_retarget_not_cached(self, temp_workspace):
+        """Test that repeated checks see a symlink that was retargeted."""
+        allowed_dir = temp_workspace / "allowed"
+        outside_dir = temp_workspace / "outside"
+        allowed_dir.mkdir()
+        outside_dir.mkdir()
+        inside_target = allowed_dir / "real.mp4"
+        inside_target.write_bytes(b"video")
+        validator = PathValidator([allowed_dir])
+
+        link = allowed_dir / "link.mp4"
+        link.symlink_to(inside_target)
+        assert validator.is_safe(str(link)) is True
+
+        link.unlink()
+        link.symlink_to(outside_dir / "secret.mp4")
+        assert validator.is_safe(str(link)) is False
+
+    def test_null_byte_rejected_before_path_construction(self, temp_workspace):
+        """Test that raw null bytes never reach Path or the regex stage."""
+        allowed_dir = temp_workspace / "allowed"
+        allowed_dir.mkdir()
+        validator = PathValidator([allowed_dir])
+
+        with patch("manim_bridge.security.path_validator.Path") as mock_path, patch(
+            "manim_bridge.security.path_validator._syntactic_reject"
+        ) as mock_reject:
+            assert validator.is_safe(str(allowed_dir) + "/video\x00.mp4") is False
+            mock_path.assert_not_called()
+            mock_reject.assert_not_called()
+
+        # Encoded %00 is left to the syntactic attack check
+        assert validator.is_safe(str(allowed_dir) + "/video%00.mp4") is False
+
     def test_safe_path_validation(self, temp_workspace):
         """Test validation of safe paths."""
         source_dir = temp_workspace / "source"
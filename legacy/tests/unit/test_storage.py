@@ -107,6 +107,24 @@ class TestManifestHandler:
         assert "new_key" in data2
         assert data2["new_key"] == "new_value"
 
+    def test_get_last_written(self, temp_workspace, sample_bridge_manifest_data):
+        """Test returning the last written data without re-reading the file."""
+        manifest_path = temp_workspace / "last_written_manifest.json"
+        manifest_path.write_text(json.dumps(sample_bridge_manifest_data))
+
+        handler = ManifestHandler(manifest_path)
+
+        # Nothing written yet: falls back to the file contents
+        assert handler.get_last_written() == sample_bridge_manifest_data
+
+        handler.add_entry("video.mp4", {"hash": "abc"})
+        with patch.object(handler, "read") as mock_read:
+            data = handler.get_last_written()
+            mock_read.assert_not_called()
+
+        assert data == handler.read(use_cache=False)
+        assert data["video.mp4"] == {"hash": "abc"}
+
     def test_read_corrupted_manifest(self, temp_workspace):
         """Test reading a corrupted manifest file."""
         manifest_path = temp_workspace / "corrupted_manifest.json"